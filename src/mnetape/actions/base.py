@@ -8,6 +8,7 @@ from __future__ import annotations
 import ast
 from collections import defaultdict
 from dataclasses import dataclass, field, replace as dataclass_replace
+from functools import cached_property
 import importlib.util
 import inspect
 import logging
@@ -300,10 +301,15 @@ def builder(_fn: Callable | None = None, *, key: str | None = None):
 
 @dataclass(frozen=True)
 class Prerequisite:
-    """A prerequisite action that should be completed before this one."""
+    """A prerequisite action that should be completed before this one.
+
+    A blocking prerequisite asks the user whether to continue when it is missing; a non-blocking one is only
+    reported as a warning on the action's completion toast.
+    """
 
     action_id: str
     message: str
+    blocking: bool = True
 
 @dataclass
 class InteractiveRunner:
@@ -311,7 +317,9 @@ class InteractiveRunner:
 
     run: Called before exec_action for this action during pipeline execution.
          Signature: (action, data, parent_widget) -> data.
-         Should mutate or replace the data object in preparation for exec_action.
+         Should mutate or replace the data object in preparation for exec_action. The runner hands over a data
+         object it owns (never a stored checkpoint or raw_original), so mutating it in place needs no defensive
+         copy, and the returned object is passed on to exec_action and stored as is.
     needs_inspection: Optional, returns True when manual review is required.
          Signature: (action) -> bool.
     build_editor_widget: Optional, returns a QWidget to embed at the top of ActionEditor.
@@ -375,10 +383,49 @@ class ActionDefinition:
     result_builder_fn: Callable | None = None
     interactive_runner: InteractiveRunner | None = None
 
-    def default_params(self) -> dict:
-        """Return a dict of parameter defaults taken from params_schema."""
+    @cached_property
+    def _default_params(self) -> dict:
         return {name: spec["default"] for name, spec in self.params_schema.items()}
 
+    def default_params(self) -> dict:
+        """Return a dict of parameter defaults taken from params_schema.
+
+        The defaults are computed once per definition; each call returns a fresh copy that callers may mutate.
+        """
+        return dict(self._default_params)
+
+    @cached_property
+    def call_kwarg_roles(self) -> dict[str, str]:
+        """Map each named call-site keyword to "param" (primary param) or "group" (named kwargs group).
+
+        Built once so call-site parsing classifies every keyword with a single dict lookup. Keywords missing from
+        the map belong to the **kwargs group when the action has one.
+        """
+        roles = {name: "group" for name in self.kwargs_groups if name != "kwargs"}
+        roles.update(dict.fromkeys(self.param_names, "param"))
+        return roles
+
+    @cached_property
+    def widget_factories(self) -> dict[str, Callable]:
+        """Map param names to their custom widget factory, built once from widget_bindings.
+
+        The first binding for a param wins, as with a linear scan of widget_bindings.
+        """
+        return {binding.param_name: binding.factory for binding in reversed(self.widget_bindings)}
+
+    @cached_property
+    def form_labels(self) -> dict[str, str]:
+        """Map each primary param name to its editor form row label ("Label:"), built once per definition."""
+        return {name: spec.get("label", name) + ":" for name, spec in self.params_schema.items()}
+
+    @cached_property
+    def advanced_form_labels(self) -> dict[str, dict[str, str]]:
+        """Map each advanced group name to {param name: form row label}, built once per definition."""
+        return {
+            group_name: {name: spec.get("label", name) + ":" for name, spec in group.items()}
+            for group_name, group in self.advanced_schema.items()
+        }
+
     def build_signature(self, func_name: str) -> str:
         """Return the canonical `def func_name(...):` line for this action."""
         sig_parts = list(self.input_vars) + list(self.param_names)
@@ -13,7 +13,7 @@ ACTION = action_from_templates(
         "mne.preprocessing.ICA": "https://mne.tools/stable/generated/mne.preprocessing.ICA.html",
     },
     prerequisites=(
-        Prerequisite("notch", "Removing line noise prevents components being wasted on it."),
-        Prerequisite("reference", "A common average reference improves ICA decomposition quality."),
+        Prerequisite("notch", "Removing line noise prevents components being wasted on it.", blocking=False),
+        Prerequisite("reference", "A common average reference improves ICA decomposition quality.", blocking=False),
     ),
 )
@@ -71,13 +71,17 @@ def list_actions() -> list[ActionDefinition]:
 def get_action_by_id(action_id: str) -> ActionDefinition | None:
     """Look up an action by its unique identifier.
 
+    Reads ACTION_REGISTRY directly once it is loaded, since this lookup runs for every action on each list
+    refresh, script generation and parse.
+
     Args:
         action_id: The action identifier string (e.g. "filter").
 
     Returns:
         The ActionDefinition, or None if not registered.
     """
-    return get_action_registry().get(action_id)
+    registry = ACTION_REGISTRY if ACTION_REGISTRY is not None else get_action_registry()
+    return registry.get(action_id)
 
 def get_action_by_title(title: str) -> ActionDefinition | None:
     """Look up an action by its display title (O(1) via reverse index).
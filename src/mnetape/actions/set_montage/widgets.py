@@ -11,14 +11,15 @@ Param widgets (via WIDGET_BINDINGS):
 
 from __future__ import annotations
 
+import functools
 import threading
-import time
-from typing import TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
 import mne
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import QEventLoop, QMetaObject, Qt, QTimer
 from PyQt6.QtWidgets import (
-    QApplication,
     QButtonGroup,
     QComboBox,
     QDialog,
@@ -47,6 +48,87 @@ MONTAGE_FILE_FILTER = (
 )
 
 
+def _run_with_progress(fn: Callable[[], Any], message: str, parent: QWidget) -> Any:
+    """Run fn on a daemon thread behind a modal busy dialog and return its result, re-raising its exception.
+
+    The GUI thread waits in a QEventLoop that the worker quits through a queued call, so the dialog keeps painting
+    without a processEvents()/sleep() poll.
+    """
+    outcome: Future = Future()
+    loop = QEventLoop()
+
+    def worker():
+        try:
+            outcome.set_result(fn())
+        except Exception as exc:
+            outcome.set_exception(exc)
+        finally:
+            QMetaObject.invokeMethod(loop, "quit", Qt.ConnectionType.QueuedConnection)
+
+    threading.Thread(target=worker, daemon=True).start()
+
+    progress = QProgressDialog(message, None, 0, 0, parent)
+    progress.setWindowModality(Qt.WindowModality.WindowModal)
+    progress.show()
+    if not outcome.done():
+        loop.exec()
+    progress.close()
+    return outcome.result()
+
+
+@functools.cache
+def _montage_ch_names(name: str) -> tuple[str, ...]:
+    """Return the channel names of a built-in montage, parsing its file only once per session."""
+    return tuple(mne.channels.make_standard_montage(name).ch_names)
+
+
+@functools.cache
+def _montage_ch_names_upper(name: str) -> frozenset[str]:
+    """Return the upper-cased channel names of a built-in montage, for case-insensitive matching."""
+    return frozenset(n.upper() for n in _montage_ch_names(name))
+
+
+@functools.cache
+def _montage_index() -> tuple[tuple[str, ...], dict[str, tuple[int, ...]]]:
+    """Return the built-in montage names and an inverted index {upper-cased channel: montage positions}.
+
+    Built once per session. Montage files are parsed concurrently on first use; threads rather than processes, as
+    a process pool's startup cost exceeds the whole scan.
+    """
+    names = tuple(mne.channels.get_builtin_montages())
+    with ThreadPoolExecutor() as executor:
+        channel_sets = list(executor.map(_montage_ch_names_upper, names))
+    index: dict[str, list[int]] = {}
+    for pos, channels in enumerate(channel_sets):
+        for ch in channels:
+            index.setdefault(ch, []).append(pos)
+    return names, {ch: tuple(positions) for ch, positions in index.items()}
+
+
+def _auto_detect_montages(raw: BaseRaw) -> list[tuple[str, float, int, int]]:
+    """Score every built-in montage against the raw's EEG channels, best match first.
+
+    Each EEG channel bumps the count of every montage that contains it, so a scan costs one index lookup per
+    channel instead of one set intersection per montage.
+
+    Returns:
+        (name, ratio, matched, total) tuples for every montage matching at least one channel.
+    """
+    eeg_picks = mne.pick_types(raw.info, eeg=True, exclude=[])
+    eeg_upper = frozenset(raw.ch_names[i].upper() for i in eeg_picks)
+    if not eeg_upper:
+        return []
+    names, index = _montage_index()
+    counts = [0] * len(names)
+    for ch in eeg_upper:
+        for pos in index.get(ch, ()):
+            counts[pos] += 1
+    total = len(eeg_upper)
+    results = [(name, matched / total, matched, total) for name, matched in zip(names, counts) if matched]
+    results.sort(key=lambda x: (-x[1], -x[2]))
+    return results
+
+
 # ── Dialogs ─────────────────────────────────────────────────────────────────
 
 
@@ -110,6 +192,9 @@ class AutoDetectDialog(QDialog):
         self.setWindowTitle("Auto-Detect Result")
         self.tied = tied
         self.raw = raw
+        # The EEG channel set does not depend on the selected montage; combo changes only take a set difference
+        eeg_picks = mne.pick_types(raw.info, eeg=True, exclude=[])
+        self._eeg_upper = frozenset(raw.ch_names[i].upper() for i in eeg_picks)
 
         _, ratio, matched, total = tied[0]
         layout = QVBoxLayout(self)
@@ -152,11 +237,7 @@ class AutoDetectDialog(QDialog):
         return self._combo.currentText()
 
     def update_unmatched(self, name: str):
-        eeg_picks = mne.pick_types(self.raw.info, eeg=True, exclude=[])
-        eeg_upper = {self.raw.ch_names[i].upper() for i in eeg_picks}
-        montage = mne.channels.make_standard_montage(name)
-        montage_upper = {n.upper() for n in montage.ch_names}
-        unmatched = eeg_upper - montage_upper
+        unmatched = self._eeg_upper - _montage_ch_names_upper(name)
         if unmatched:
             self.unmatched_label.setText(f"Unmatched channels: {', '.join(sorted(unmatched))}")
         else:
@@ -230,7 +311,7 @@ class MontageDialog(QDialog):
         path, _ = QFileDialog.getOpenFileName(self, "Select Montage File", "", MONTAGE_FILE_FILTER)
         if path:
             self._montage_path = path
-            self.file_label.setText(path.rsplit("/", 1)[-1])
+            self.file_label.setText(Path(path).name)
             self.radio_import.setChecked(True)
 
     def apply(self):
@@ -303,47 +384,7 @@ class MontageDialog(QDialog):
         return None
 
     def _auto_detect_in_thread(self) -> list:
-        result: list = []
-        error: list = [None]
-        finished = threading.Event()
-
-        def _worker():
-            try:
-                result.extend(self._auto_detect())
-            except Exception as exc:
-                error[0] = exc
-            finally:
-                finished.set()
-
-        t = threading.Thread(target=_worker, daemon=True)
-        t.start()
-
-        progress = QProgressDialog("Scanning montages...", None, 0, 0, self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.show()
-        while not finished.is_set():
-            QApplication.processEvents()
-            time.sleep(0.05)
-        progress.close()
-
-        if error[0]:
-            raise error[0]
-        return result
-
-    def _auto_detect(self) -> list:
-        eeg_picks = mne.pick_types(self.raw.info, eeg=True, exclude=[])
-        eeg_upper = {self.raw.ch_names[i].upper() for i in eeg_picks}
-        if not eeg_upper:
-            return []
-        results = []
-        for name in mne.channels.get_builtin_montages():
-            montage = mne.channels.make_standard_montage(name)
-            montage_upper = {n.upper() for n in montage.ch_names}
-            matched = len(eeg_upper & montage_upper)
-            if matched > 0:
-                results.append((name, matched / len(eeg_upper), matched, len(eeg_upper)))
-        results.sort(key=lambda x: (-x[1], -x[2]))
-        return results
+        return _run_with_progress(lambda: _auto_detect_montages(self.raw), "Scanning montages...", self)
 
 
 # ── Inline param widget ──────────────────────────────────────────────────────
@@ -465,42 +506,11 @@ class MontageConfigWidget(QWidget):
         if self._raw is None:
             return
 
-        results: list = []
-        error: list = [None]
-        finished = threading.Event()
-
-        def _worker():
-            try:
-                eeg_picks = mne.pick_types(self._raw.info, eeg=True, exclude=[])
-                eeg_upper = {self._raw.ch_names[i].upper() for i in eeg_picks}
-                if not eeg_upper:
-                    finished.set()
-                    return
-                for name in mne.channels.get_builtin_montages():
-                    montage = mne.channels.make_standard_montage(name)
-                    montage_upper = {n.upper() for n in montage.ch_names}
-                    matched = len(eeg_upper & montage_upper)
-                    if matched > 0:
-                        results.append((name, matched / len(eeg_upper), matched, len(eeg_upper)))
-                results.sort(key=lambda x: (-x[1], -x[2]))
-            except Exception as exc:
-                error[0] = exc
-            finally:
-                finished.set()
-
-        t = threading.Thread(target=_worker, daemon=True)
-        t.start()
-
-        progress = QProgressDialog("Scanning montages…", None, 0, 0, self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.show()
-        while not finished.is_set():
-            QApplication.processEvents()
-            time.sleep(0.05)
-        progress.close()
-
-        if error[0]:
-            QMessageBox.critical(self, "Error", f"Auto-detect failed:\n{error[0]}")
+        raw = self._raw
+        try:
+            results = _run_with_progress(lambda: _auto_detect_montages(raw), "Scanning montages…", self)
+        except Exception as exc:
+            QMessageBox.critical(self, "Error", f"Auto-detect failed:\n{exc}")
             return
         if not results:
             QMessageBox.information(self, "Auto-Detect", "No matching montages found.")
@@ -513,14 +523,13 @@ class MontageConfigWidget(QWidget):
             return
 
         name = dlg.selected_name()
-        montage = mne.channels.make_standard_montage(name)
         eeg_picks = mne.pick_types(self._raw.info, eeg=True, exclude=[])
         eeg_names = [self._raw.ch_names[i] for i in eeg_picks]
-        montage_upper = {n.upper() for n in montage.ch_names}
+        montage_upper = _montage_ch_names_upper(name)
         unmatched = [ch for ch in eeg_names if ch.upper() not in montage_upper]
 
         if unmatched:
-            remap_dlg = ChannelRemapDialog(unmatched, montage.ch_names, parent=self)
+            remap_dlg = ChannelRemapDialog(unmatched, list(_montage_ch_names(name)), parent=self)
             if remap_dlg.exec():
                 self._renames = remap_dlg.get_renames() or None
 
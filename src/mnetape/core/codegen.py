@@ -11,10 +11,11 @@ Script format:
 
 import ast
 import dataclasses
+import functools
 import logging
 import re
 
-from mnetape.actions.registry import get_action_by_id, get_action_title
+from mnetape.actions.registry import get_action_by_id, get_action_by_title, get_action_title
 from mnetape.core.models import CUSTOM_ACTION_ID, ActionConfig, ActionStatus, DataType
 
 logger = logging.getLogger(__name__)
@@ -24,15 +25,106 @@ BASE_IMPORTS = [
     "import mne",
     "import numpy as np",
 ]
+BASE_IMPORTS_TEXT = "\n".join(BASE_IMPORTS)
 
-# -------- Function name deduplication --------
+# Fixed layout pieces of the generated script
+SCRIPT_HEADER = (
+    "# EEG Preprocessing Pipeline",
+    "# Auto-generated by the MNETAPE software.",
+)
+FUNCS_SECTION_HEADER = "# --- Functions ---"
+PIPELINE_SECTION_HEADER = "# --- Pipeline ---"
 
-def normalize_body(body_source: str) -> str:
-    """Return ast dump of a body string for structural comparison."""
+# Preamble lines generate_full_script always emits on its own
+STANDARD_PREAMBLE_LINES = frozenset({*SCRIPT_HEADER, *BASE_IMPORTS})
+
+# Section and block markers of the generated script
+FUNCS_SECTION_RE = re.compile(r"^#\s*---\s*Functions\s*---", re.MULTILINE)
+PIPELINE_SECTION_RE = re.compile(r"^#\s*---\s*Pipeline\s*---", re.MULTILINE)
+ANY_SECTION_RE = re.compile(r"^#\s*---\s*(Functions|Pipeline)\s*---", re.MULTILINE)
+BLOCK_HEADER_RE = re.compile(r"^#\s*\[(\d+)]\s*(.*?)\s*$")
+# For function-name fallback lookup: extract name from "x = func_name(" call sites
+FUNC_NAME_RE = re.compile(r"=\s*(\w+)\s*\(")
+
+# -------- AST caching --------
+
+@functools.lru_cache(maxsize=256)
+def parse_cached(source: str, mode: str = "exec") -> ast.AST | None:
+    """Parse source code, memoizing the resulting tree.
+
+    The same bodies and call sites are parsed over and over while the script is regenerated and re-parsed on
+    every edit, so trees are cached by source string. Returned trees are shared and must not be mutated.
+
+    Returns:
+        The parsed tree, or None if the source is not valid Python.
+    """
     try:
-        return ast.dump(ast.parse(body_source), include_attributes=False)
+        return ast.parse(source, mode=mode)
     except SyntaxError:
+        return None
+
+# -------- Call-site caching --------
+
+# Generated call sites keyed by (action_id, func_name, context_type, params key, advanced_params key).
+# Registered definitions never change, so an entry stays valid for the whole session.
+CALL_SITE_CACHE: dict[tuple, str] = {}
+MAX_CALL_SITE_CACHE = 512
+
+
+def literal_key(value):
+    """Return a hashable canonical form of a plain literal value, or None if it is not one.
+
+    Scalars are tagged with their type so that values that compare equal but render differently (True and 1,
+    0.0 and -0.0) get distinct keys. Containers keep their order, since it is preserved in the generated code.
+    """
+    if value is None or isinstance(value, (bool, int, str)):
+        return type(value), value
+    if isinstance(value, float):
+        return float, repr(value)
+    if isinstance(value, (list, tuple)):
+        items = tuple(literal_key(v) for v in value)
+        return None if None in items else (type(value), items)
+    if isinstance(value, dict):
+        items = tuple((literal_key(k), literal_key(v)) for k, v in value.items())
+        return None if any(None in pair for pair in items) else (dict, items)
+    return None
+
+
+def cached_call_site(action_def, action: ActionConfig, func_name: str, context_type: DataType) -> str:
+    """Return the call-site code for action, building it only when this exact configuration was not seen before.
+
+    Regenerating the script after one action changed would otherwise re-render every parameter value of every
+    unchanged action through the AST. Params holding anything other than plain literals are not cached.
+    """
+    params_key = literal_key(action.params)
+    advanced_key = literal_key(action.advanced_params)
+    cacheable = params_key is not None and advanced_key is not None
+    key = (action.action_id, func_name, context_type, params_key, advanced_key)
+    code = CALL_SITE_CACHE.get(key) if cacheable else None
+    if code is None:
+        params = {**action_def.default_params(), **action.params}
+        code = action_def.build_call_site(func_name, params, action.advanced_params or None, context_type)
+        if not cacheable:
+            return code
+        if len(CALL_SITE_CACHE) >= MAX_CALL_SITE_CACHE:
+            # Drop the oldest entry; dicts keep insertion order
+            del CALL_SITE_CACHE[next(iter(CALL_SITE_CACHE))]
+        CALL_SITE_CACHE[key] = code
+    return code
+
+# -------- Function name deduplication --------
+
+@functools.lru_cache(maxsize=256)
+def normalize_body(body_source: str) -> str:
+    """Return ast dump of a body string for structural comparison.
+
+    Memoized because the same canonical bodies are normalized on every script generation and parse. Cached
+    results are the same string objects, so comparing two keys for an unchanged body is an identity check.
+    """
+    tree = parse_cached(body_source)
+    if tree is None:
         return body_source
+    return ast.dump(tree, include_attributes=False)
 
 def bodies_match(actual: str, canonical: str) -> bool:
     """Return True when two body strings have the same AST structure."""
@@ -48,6 +140,10 @@ def all_canonical_bodies(action_def) -> list[str]:
 
     Used by the parser to decide whether a function body was user-modified.
     """
+    if not action_def.variants:
+        # Flat action: no recursive walk needed
+        return [action_def.body_source, *action_def.param_variants.values()]
+
     bodies: list[str] = []
 
     def _collect(adef) -> None:
@@ -59,6 +155,18 @@ def all_canonical_bodies(action_def) -> list[str]:
     _collect(action_def)
     return bodies
 
+@functools.cache
+def canonical_body_keys(action_id: str) -> frozenset[str]:
+    """Return the normalized form of every canonical body of a registered action.
+
+    Lets the parser normalize a script body once and test membership, instead of re-normalizing both sides
+    for every canonical body. Registered definitions never change, so the result is cached per action_id.
+    """
+    action_def = get_action_by_id(action_id)
+    if action_def is None:
+        return frozenset()
+    return frozenset(normalize_body(body) for body in all_canonical_bodies(action_def))
+
 def get_types_for_actions(actions: list[ActionConfig]) -> list[DataType]:
     """Return the input DataType for each action in the pipeline.
 
@@ -173,22 +281,18 @@ def extract_custom_preamble(script: str, actions: list[ActionConfig]) -> list[st
     Returns:
         Ordered list of custom preamble lines (stripped, non-blank).
     """
-    from mnetape.actions.registry import get_action_by_id as _get_action_by_id
-
-    section_match = re.search(r"^#\s*---\s*(Functions|Pipeline)\s*---", script, re.MULTILINE)
-    preamble = script[: section_match.start()].strip() if section_match else script.strip()
+    section_match = ANY_SECTION_RE.search(script)
+    preamble = script[: section_match.start()] if section_match else script
 
-    standard: set[str] = {
-        "# EEG Preprocessing Pipeline",
-        "# Auto-generated by the MNETAPE software.",
-        *BASE_IMPORTS,
-    }
+    standard: set[str] = set(STANDARD_PREAMBLE_LINES)
     for action in actions:
-        action_def = _get_action_by_id(action.action_id)
+        action_def = get_action_by_id(action.action_id)
         if action_def:
             standard.update(action_def.extra_imports)
 
-    return [ln.strip() for ln in preamble.split("\n") if ln.strip() and ln.strip() not in standard]
+    # Strip each line once, then drop blanks and auto-generated lines
+    stripped_lines = (ln.strip() for ln in preamble.split("\n"))
+    return [ln for ln in stripped_lines if ln and ln not in standard]
 
 
 def pipeline_canonical_code(actions: list[ActionConfig], extra_preamble: list[str] | None = None) -> str:
@@ -225,56 +329,43 @@ def generate_full_script(actions: list[ActionConfig], extra_preamble: list[str]
     func_names = assign_func_names(actions, types)
     emitted_funcs = collect_func_defs(actions, func_names, types)
 
-    all_imports: list[str] = list(BASE_IMPORTS)
-    seen_imports: set[str] = set(BASE_IMPORTS)
+    # Insertion-ordered dict: deduplicates and keeps first-seen order in one container
+    imports: dict[str, None] = dict.fromkeys(BASE_IMPORTS)
     for action in actions:
         action_def = get_action_by_id(action.action_id)
-        if action_def:
-            for imp in action_def.extra_imports:
-                if imp not in seen_imports:
-                    all_imports.append(imp)
-                    seen_imports.add(imp)
-    merged_imports = "\n".join(all_imports)
+        if action_def and action_def.extra_imports:
+            imports.update(dict.fromkeys(action_def.extra_imports))
+    # Most pipelines only need the base imports, whose block is prebuilt
+    merged_imports = "\n".join(imports) if len(imports) > len(BASE_IMPORTS) else BASE_IMPORTS_TEXT
 
-    pipeline_lines: list[str] = []
+    # One pre-joined chunk per action: header, code and a trailing blank line
+    pipeline_blocks: list[str] = []
     for i, (action, func_name, context_type) in enumerate(zip(actions, func_names, types), 1):
-        title = get_action_title(action)
-        pipeline_lines.append(f"# [{i}] {title}")
-
         if action.action_id == CUSTOM_ACTION_ID:
-            pipeline_lines.append(action.custom_code or "")
+            code = action.custom_code or ""
         else:
             action_def = get_action_by_id(action.action_id)
             if action_def:
-                params = {**action_def.default_params(), **action.params}
-                pipeline_lines.append(action_def.build_call_site(func_name, params, action.advanced_params or None, context_type))
+                code = cached_call_site(action_def, action, func_name, context_type)
             else:
-                pipeline_lines.append(f"# (unknown action: {action.action_id})")
+                code = f"# (unknown action: {action.action_id})"
 
-        pipeline_lines.append("")
+        pipeline_blocks.append(f"# [{i}] {get_action_title(action)}\n{code}\n")
 
-    lines: list[str] = [
-        "# EEG Preprocessing Pipeline",
-        "# Auto-generated by the MNETAPE software.",
-        "",
-        merged_imports,
-        "",
-    ]
+    lines: list[str] = [*SCRIPT_HEADER, "", merged_imports, ""]
 
     if extra_preamble:
         for ln in extra_preamble:
-            if ln not in seen_imports:
+            if ln not in imports:
                 lines.append(ln)
         lines.append("")
 
     if emitted_funcs:
-        lines += ["", "# --- Functions ---", ""]
-        for func_def in emitted_funcs.values():
-            lines.append(func_def)
-            lines.append("")
+        lines += ["", FUNCS_SECTION_HEADER, ""]
+        lines.extend(f"{func_def}\n" for func_def in emitted_funcs.values())
 
-    lines += ["", "# --- Pipeline ---", ""]
-    lines.extend(pipeline_lines)
+    lines += ["", PIPELINE_SECTION_HEADER, ""]
+    lines.extend(pipeline_blocks)
 
     return "\n".join(lines)
 
@@ -289,8 +380,8 @@ def extract_func_defs(script: str) -> dict[str, str]:
     result: dict[str, str] = {}
 
     # Find Functions section
-    func_match = re.search(r"^#\s*---\s*Functions\s*---", script, re.MULTILINE)
-    pipeline_match = re.search(r"^#\s*---\s*Pipeline\s*---", script, re.MULTILINE)
+    func_match = FUNCS_SECTION_RE.search(script)
+    pipeline_match = PIPELINE_SECTION_RE.search(script)
     if not func_match:
         return result
 
@@ -298,9 +389,8 @@ def extract_func_defs(script: str) -> dict[str, str]:
     func_end = pipeline_match.start() if pipeline_match else len(script)
     func_section = script[func_start:func_end]
 
-    try:
-        tree = ast.parse(func_section)
-    except SyntaxError:
+    tree = parse_cached(func_section)
+    if tree is None:
         return result
 
     for node in tree.body:
@@ -310,6 +400,11 @@ def extract_func_defs(script: str) -> dict[str, str]:
 
     return result
 
+def strip_dedup_suffix(func_name: str) -> str:
+    """Remove a numeric deduplication suffix (e.g. "filter_2" -> "filter") added by assign_func_names."""
+    head, sep, tail = func_name.rpartition("_")
+    return head if sep and tail.isdecimal() else func_name
+
 def parse_script_to_actions(script: str) -> list[ActionConfig]:
     """Parse a pipeline script back into a list of ActionConfig objects.
     Falls back gracefully to treating unknown blocks as custom actions.
@@ -321,45 +416,32 @@ def parse_script_to_actions(script: str) -> list[ActionConfig]:
         Ordered list of ActionConfig objects.
     """
     # Detect format
-    if "# --- Pipeline ---" not in script:
+    if PIPELINE_SECTION_HEADER not in script:
         logger.warning("Script does not contain '# --- Pipeline ---' section; returning empty list")
         return []
 
     func_defs = extract_func_defs(script)
 
     # Find pipeline section
-    pipeline_match = re.search(r"^#\s*---\s*Pipeline\s*---", script, re.MULTILINE)
+    pipeline_match = PIPELINE_SECTION_RE.search(script)
     if not pipeline_match:
         return []
 
-    pipeline_text = script[pipeline_match.end():]
-    lines = pipeline_text.split("\n")
-
-    header_re = re.compile(r"^#\s*\[(\d+)]\s*(.*?)\s*$")
-    # For function-name fallback lookup: extract name from "x = func_name(" call sites
-    func_name_re = re.compile(r"=\s*(\w+)\s*\(")
-    dedup_suffix_re = re.compile(r"_\d+$")
+    # Split the pipeline section into (title, body lines) blocks, matching each line once.
+    # Headers always start with "#", so the regex only runs on comment lines.
+    blocks: list[tuple[str, list[str]]] = []
+    for line in script[pipeline_match.end():].split("\n"):
+        stripped = line.strip()
+        hm = BLOCK_HEADER_RE.match(stripped) if stripped.startswith("#") else None
+        if hm:
+            blocks.append((hm.group(2).strip(), []))
+        elif blocks:
+            blocks[-1][1].append(line)
 
     actions: list[ActionConfig] = []
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        hm = header_re.match(line)
-        if not hm:
-            i += 1
-            continue
-
-        title = hm.group(2).strip()
-        i += 1
-
-        # Collect every line belonging to this action (up to the next header)
-        body_lines: list[str] = []
-        while i < len(lines) and not header_re.match(lines[i].strip()):
-            body_lines.append(lines[i])
-            i += 1
-
+    for title, body_lines in blocks:
         # Non-comment, non-blank code lines in the body
-        code_lines = [l.strip() for l in body_lines if l.strip() and not l.strip().startswith("#")]
+        code_lines = [l for l in map(str.strip, body_lines) if l and not l.startswith("#")]
 
         if not code_lines:
             # Empty body, fall back to title lookup
@@ -377,9 +459,9 @@ def parse_script_to_actions(script: str) -> list[ActionConfig]:
             # Resolve action: title lookup first, then function-name fallback
             action_def = get_action_by_title(title)
             if action_def is None:
-                m = func_name_re.search(call_site_line)
+                m = FUNC_NAME_RE.search(call_site_line)
                 if m:
-                    base_name = dedup_suffix_re.sub("", m.group(1))
+                    base_name = strip_dedup_suffix(m.group(1))
                     action_def = get_action_by_id(base_name)
 
             if action_def is not None:
@@ -390,7 +472,7 @@ def parse_script_to_actions(script: str) -> list[ActionConfig]:
 
                 if func_name and func_name in func_defs:
                     actual_body = func_defs[func_name]
-                    if not any(bodies_match(actual_body, cb) for cb in all_canonical_bodies(action_def)):
+                    if normalize_body(actual_body) not in canonical_body_keys(action_def.action_id):
                         action.custom_code = actual_body
                         action.is_custom = True
 
@@ -410,11 +492,6 @@ def parse_script_to_actions(script: str) -> list[ActionConfig]:
 
     return actions
 
-def get_action_by_title(title: str):
-    """Look up an action definition by display title."""
-    from mnetape.actions.registry import get_action_by_title
-    return get_action_by_title(title)
-
 def parse_call_site(
     call_site: str,
     action_def,
@@ -430,22 +507,17 @@ def parse_call_site(
     call_node = None
 
     # Try expression mode first (bare call), then statement mode (assignment)
-    try:
-        expr_tree = ast.parse(call_site, mode="eval")
-        if isinstance(expr_tree.body, ast.Call):
-            call_node = expr_tree.body
-    except SyntaxError:
-        pass
+    expr_tree = parse_cached(call_site, mode="eval")
+    if expr_tree is not None and isinstance(expr_tree.body, ast.Call):
+        call_node = expr_tree.body
 
     if call_node is None:
-        try:
-            stmt_tree = ast.parse(call_site)
+        stmt_tree = parse_cached(call_site)
+        if stmt_tree is not None:
             for node in ast.walk(stmt_tree):
                 if isinstance(node, ast.Call):
                     call_node = node
                     break
-        except SyntaxError:
-            pass
 
     if call_node is None:
         return action_def.default_params(), {}, ""
@@ -468,19 +540,20 @@ def parse_call_site(
             pass
 
     # Split into primary vs advanced
-    primary_names = set(action_def.param_names)
-    kwargs_group_names = set(action_def.kwargs_groups) - {"kwargs"}
+    roles = action_def.call_kwarg_roles
+    accepts_kwargs = "kwargs" in action_def.kwargs_groups
     params = action_def.default_params()
     advanced_params: dict[str, dict] = {}
 
     for name, value in all_kwargs.items():
-        if name in primary_names:
+        role = roles.get(name)
+        if role == "param":
             params[name] = value
-        elif name in kwargs_group_names:
+        elif role == "group":
             # Named group dict value
             if isinstance(value, dict):
                 advanced_params[name] = value
-        elif "kwargs" in action_def.kwargs_groups:
+        elif accepts_kwargs:
             # Extra kwarg for **kwargs group
             advanced_params.setdefault("kwargs", {})[name] = value
         # else: unknown kwarg, ignore
@@ -6,6 +6,7 @@ Supported formats: FIF, EDF, BDF, GDF, BrainVision (.vhdr), EEGLAB (.set), CNT,
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Callable
 
@@ -23,10 +24,13 @@ READERS: dict[str, tuple[Callable, str]] = {
     ".mff": (mne.io.read_raw_egi, "*.mff"),
 }
 
+# Multi-suffix extensions (e.g. .fif.gz) that must be matched as a single token
+COMPOUND_EXTS: tuple[str, ...] = tuple(ext for ext in READERS if ext.count(".") > 1)
+
 def detect_extension(path: str | Path) -> str:
     """Return the normalized file extension for path.
 
-    Handles the compound .fif.gz extension as a single token instead of returning only .gz.
+    Handles compound extensions such as .fif.gz as a single token instead of returning only .gz.
 
     Args:
         path: Filesystem path to inspect.
@@ -37,14 +41,19 @@ def detect_extension(path: str | Path) -> str:
     p = Path(path)
     lower_name = p.name.lower()
 
-    # Handle .fif.gz as a special case since it has two suffixes
-    if lower_name.endswith(".fif.gz"):
-        return ".fif.gz"
+    # Compound extensions have two suffixes, so Path.suffix alone would only see the last one
+    for compound in COMPOUND_EXTS:
+        if lower_name.endswith(compound):
+            return compound
 
     return p.suffix.lower()
 
+@functools.cache
 def open_file_dialog_filter() -> str:
-    """Return a file dialog filter string for supported EEG formats."""
+    """Return a file dialog filter string for supported EEG formats.
+
+    READERS is fixed at import time, so the string is built once and cached.
+    """
 
     patterns = sorted({pattern for _, pattern in READERS.values()})
     all_supported = " ".join(patterns)
@@ -3,6 +3,9 @@
 Each checkpoint is serialized to a FIF file in a per-session temp directory immediately after an action completes.
 An LRU cache keeps recently accessed states in RAM to avoid redundant disk I/O during navigation
 and sequential execution.
+
+Slots can carry a key identifying the code chain that produced them. Keyed slots dropped by truncate() are retired
+rather than deleted, so re-running an unchanged step (e.g. after an undo) can reclaim the checkpoint.
 """
 
 from __future__ import annotations
@@ -12,7 +15,7 @@ import shutil
 import tempfile
 from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Hashable
 
 import threading
 
@@ -107,12 +110,22 @@ class DataStore:
             The slot index is preserved as None so the pipeline structure stays intact.
         thread_runner: Optional callable. When set, disk reads triggered from the GUI main thread are wrapped
         in a background thread with a progress dialog. Worker-thread reads bypass this.
+        max_retired_states: Maximum number of truncated keyed checkpoints kept on disk for reclaim().
+            They count against max_disk_states together with the live slots.
+            The highest-indexed ones are deleted first, since a reclaim has to start from the lowest index.
     """
 
     def __init__(self, cache_size: int = 2):
         self.tmpdir: Path | None = None
         # Each slot: None (no file) or (type_tag, base_path)
         self.slots: list[tuple[str, Path] | None] = []
+        # Parallel to slots: key of the code chain that produced each slot, or None when unknown
+        self.keys: list[Hashable | None] = []
+        # Truncated keyed slots: key -> (index, slot)
+        self.retired: dict[Hashable, tuple[int, tuple[str, Path]]] = {}
+        self.max_retired_states = 4
+        # Bumped whenever slot 0 is rewritten; serves as the root of the key chain
+        self.generation = 0
         self.cache: OrderedDict[int, Any] = OrderedDict()
         self.cache_size = cache_size
         self.max_disk_states: int = 0
@@ -147,11 +160,34 @@ class DataStore:
             if slot is not None:
                 delete_slot_files(slot[1])
             self.slots[i] = None
+            self.keys[i] = None
             self.cache.pop(i, None)
             logger.debug("DataStore: evicted slot %d (max_disk_states=%d)", i, self.max_disk_states)
+        self.trim_retired()
+
+    def trim_retired(self) -> None:
+        """Delete retired checkpoints beyond max_retired_states or beyond what max_disk_states leaves room for.
+
+        Live slots take priority: retired files only use the disk budget they leave free.
+        The highest-indexed ones are deleted first, since a reclaim has to start from the lowest index.
+        """
+        limit = self.max_retired_states
+        if self.max_disk_states:
+            on_disk = sum(1 for s in self.slots if s is not None)
+            limit = min(limit, max(0, self.max_disk_states - on_disk))
+        while len(self.retired) > limit:
+            key = max(self.retired, key=lambda k: self.retired[k][0])
+            delete_slot_files(self.retired.pop(key)[1][1])
 
     def write_slot(self, index: int, data: Any) -> None:
         old = self.slots[index]
+        if index == 0:
+            # Every retired checkpoint descends from the previous slot 0
+            self.purge_retired()
+            self.generation += 1
+            self.keys[0] = self.generation
+        else:
+            self.keys[index] = None
 
         if data is None:
             if old is not None:
@@ -239,18 +275,80 @@ class DataStore:
     def append(self, data: Any) -> None:
         index = len(self.slots)
         self.slots.append(None)  # reserve the slot
+        self.keys.append(None)
         self.write_slot(index, data)
 
+    def has_data(self, index: int) -> bool:
+        """Return True when the slot at index holds data, without loading it from disk."""
+        return 0 <= index < len(self.slots) and (self.slots[index] is not None or index in self.cache)
+
+    def release(self, index: int) -> bool:
+        """Drop the cached object at index when a disk file backs it.
+
+        The caller then owns the object and may mutate it; the next read of index loads it from disk.
+
+        Returns:
+            True if the object was released, False when the slot only lives in RAM (cache left untouched).
+        """
+        if not (0 <= index < len(self.slots)) or self.slots[index] is None:
+            return False
+        self.cache.pop(index, None)
+        return True
+
     # -------- Management --------
 
+    def key_at(self, index: int) -> Hashable | None:
+        """Return the key of the slot at index, or None when out of range or unkeyed."""
+        return self.keys[index] if 0 <= index < len(self.keys) else None
+
+    def set_key(self, index: int, key: Hashable | None) -> None:
+        """Record the key of the code chain that produced the slot at index."""
+        self.keys[index] = key
+
+    def reclaim(self, index: int, key: Hashable) -> bool:
+        """Re-append a retired checkpoint when its key matches and it belongs at index.
+
+        Returns:
+            True if the slot was restored as the new last slot, False otherwise.
+        """
+        entry = self.retired.get(key)
+        if entry is None or entry[0] != index or index != len(self.slots):
+            return False
+        del self.retired[key]
+        self.slots.append(entry[1])
+        self.keys.append(key)
+        logger.debug("DataStore: reclaimed retired slot %d", index)
+        self.evict_oldest_disk_slot()
+        return True
+
+    def purge_retired(self) -> None:
+        """Delete the disk files of every retired checkpoint."""
+        for _, slot in self.retired.values():
+            delete_slot_files(slot[1])
+        self.retired.clear()
+
     def truncate(self, n: int) -> None:
-        """Drop all slots from index n onward, deleting their disk files."""
+        """Drop all slots from index n onward.
+
+        Keyed on-disk slots are retired for a later reclaim() unless slot 0 itself is dropped;
+        all others have their disk files deleted.
+        """
+        if n == 0:
+            self.purge_retired()
         for i in range(n, len(self.slots)):
             slot = self.slots[i]
-            if slot is not None:
+            key = self.keys[i]
+            if slot is not None and key is not None and n > 0:
+                old = self.retired.pop(key, None)
+                if old is not None:
+                    delete_slot_files(old[1][1])
+                self.retired[key] = (i, slot)
+            elif slot is not None:
                 delete_slot_files(slot[1])
             self.cache.pop(i, None)
         self.slots = self.slots[:n]
+        self.keys = self.keys[:n]
+        self.trim_retired()
 
     def clear(self) -> None:
         """Remove all checkpoints and delete the temporary directory."""
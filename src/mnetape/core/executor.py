@@ -4,7 +4,10 @@ Provides exec_action as the primary entry point: runs a call-site string in a sc
 has function definitions preloaded, then extracts the output data object.
 """
 
+import functools
 import logging
+from types import CodeType
+
 import mne
 import numpy
 
@@ -20,6 +23,22 @@ SCOPE_VAR: dict[DataType, str | None] = {
     DataType.ICA: None,  # ICA is handled via structured unpacking
 }
 
+# Modules preloaded into every execution scope; copied per call so actions cannot leak names
+BASE_SCOPE: dict = {
+    "mne": mne,
+    "np": numpy,
+    "numpy": numpy,
+}
+
+@functools.lru_cache(maxsize=128)
+def compile_cached(source: str) -> CodeType:
+    """Compile source for exec, memoizing the code object.
+
+    The same function definitions and call sites are re-executed on every run and re-run, so
+    repeated executions skip parsing and compilation.
+    """
+    return compile(source, "<string>", "exec")
+
 def exec_action(
     call_site: str,
     func_defs: str,
@@ -52,11 +71,7 @@ def exec_action(
     """
     logger.debug("Executing action_id=%s", action.action_id)
 
-    scope: dict = {
-        "mne": mne,
-        "np": numpy,
-        "numpy": numpy,
-    }
+    scope: dict = dict(BASE_SCOPE)
 
     # Inject input data
     if input_type == DataType.ICA:
@@ -73,14 +88,14 @@ def exec_action(
     # Define functions
     if func_defs:
         try:
-            exec(func_defs, scope, scope)
+            exec(compile_cached(func_defs), scope)
         except Exception:
             logger.exception("Failed to define functions for action_id=%s", action.action_id)
             raise
 
     # Run the call site / action code
     try:
-        exec(call_site, scope, scope)
+        exec(compile_cached(call_site), scope)
     except Exception:
         logger.exception("Action execution failed for action_id=%s", action.action_id)
         raise
@@ -122,7 +122,7 @@ class ActionResult:
 
 # ------- Action configuration --------
 
-@dataclass
+@dataclass(slots=True)
 class ActionConfig:
     """Mutable runtime configuration for a single preprocessing action.
 
@@ -150,6 +150,32 @@ class ActionConfig:
     advanced_params: dict = field(default_factory=dict)
     result: ActionResult | None = None
 
+    def same_config(self, other: "ActionConfig") -> bool:
+        """Return True when other would generate and run the same code, ignoring execution state."""
+        return (
+            self.action_id == other.action_id
+            and self.params == other.params
+            and self.advanced_params == other.advanced_params
+            and self.custom_code == other.custom_code
+            and self.is_custom == other.is_custom
+            and self.title_override == other.title_override
+        )
+
+    def config_copy(self) -> "ActionConfig":
+        """Return an independent copy of the configuration, in the pending state.
+
+        Used for undo/redo snapshots. Status, error and result are left out: a restored snapshot is invalidated from
+        its first difference anyway, and a result's matplotlib figure would otherwise stay alive on the stacks.
+        """
+        return ActionConfig(
+            action_id=self.action_id,
+            params=copy.deepcopy(self.params),
+            custom_code=self.custom_code,
+            is_custom=self.is_custom,
+            title_override=self.title_override,
+            advanced_params=copy.deepcopy(self.advanced_params),
+        )
+
     def reset(self):
         """Reset action to pending state."""
         self.status = ActionStatus.PENDING
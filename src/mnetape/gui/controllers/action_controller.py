@@ -19,6 +19,7 @@ from mnetape.core.models import CUSTOM_ACTION_ID, ActionConfig, ICASolution
 from mnetape.gui.dialogs import ActionEditor, AddActionDialog
 
 PROTECTED_ACTION_IDS = frozenset({"load_file", "set_montage"})
+STEP_CHANGE_INTERVAL_MS = 150
 
 if TYPE_CHECKING:
     from mnetape.gui.pages.preprocessing_page import PreprocessingPage
@@ -33,9 +34,64 @@ class ActionController:
     def __init__(self, window: "PreprocessingPage") -> None:
         self.w = window
         self.state = window.state
-        self.pending_code: str | None = None
+        self.code_edit_pending = False
         self.code_edit_timer: QTimer | None = None
 
+        # Coalesces action-list refreshes requested by code edits into one per event-loop pass
+        self.list_refresh_timer = QTimer(window)
+        self.list_refresh_timer.setSingleShot(True)
+        self.list_refresh_timer.timeout.connect(self.refresh_action_list)
+
+        # Rapid step selections are debounced so only the last one triggers a visualization update
+        self.step_change_timer = QTimer(window)
+        self.step_change_timer.setSingleShot(True)
+        self.step_change_timer.setInterval(STEP_CHANGE_INTERVAL_MS)
+        self.step_change_timer.timeout.connect(self.w.update_visualization)
+
+        # Context menu is built once; show_action_context_menu only retargets it
+        self.context_row = -1
+        self.context_menu = self.build_context_menu()
+
+    def build_context_menu(self) -> QMenu:
+        """Create the persistent action context menu.
+
+        Each entry stores a command name in QAction.data(); on_context_menu_triggered dispatches on it.
+        """
+        menu = QMenu(self.w)
+        menu.triggered.connect(self.on_context_menu_triggered)
+
+        menu.addAction("Edit Settings...").setData("edit")
+        menu.addSeparator()
+        menu.addAction("Run This").setData("run_single")
+        menu.addAction("Run This and Above").setData("run_to")
+
+        self.results_separator = menu.addSeparator()
+        self.view_results_action = menu.addAction("View Results")
+        self.view_results_action.setData("view_results")
+
+        menu.addSeparator()
+        menu.addAction("Export data at this step...").setData("export")
+        menu.addSeparator()
+        menu.addAction("Remove").setData("remove")
+
+        return menu
+
+    def on_context_menu_triggered(self, action):
+        """Run the context-menu command stored on the triggered entry for context_row."""
+        command = action.data()
+        if command == "edit":
+            self.on_action_double_clicked()
+        elif command == "run_single":
+            self.w.runner.run_single()
+        elif command == "run_to":
+            self.w.runner.run_to_selected()
+        elif command == "view_results":
+            self.w.open_action_results(self.context_row)
+        elif command == "export":
+            self.w.files.export_file(self.context_row)
+        elif command == "remove":
+            self.remove_action()
+
     def add_action(self):
         """Open the Add Action dialog and append the selected action to the pipeline."""
         dialog = AddActionDialog(self.w)
@@ -76,10 +132,7 @@ class ActionController:
         self.state.push_undo()
         self.state.pipeline_dirty = True
         self.state.actions.pop(row)
-        self.state.data_states.truncate(row)
-        for action in self.state.actions[row:]:
-            if not action.is_custom:
-                action.reset()
+        self.state.invalidate_from(row, keep_custom=True)
         self.w.update_action_list()
 
     def move_action_to(self, from_row: int, to_row: int):
@@ -100,14 +153,9 @@ class ActionController:
         self.state.pipeline_dirty = True
         action = actions.pop(from_row)
         actions.insert(to_row, action)
-        first_changed = min(from_row, to_row)
-        self.state.data_states.truncate(first_changed)
-        for a in self.state.actions[first_changed:]:
-            if not a.is_custom:
-                a.reset()
+        self.state.invalidate_from(min(from_row, to_row), max(from_row, to_row) + 1, keep_custom=True)
         self.w.update_action_list()
         self.w.set_selected_action_row(to_row)
-        self.w.update_button_states()
 
     def move_action(self, direction: int):
         """Move the currently selected action up or down in the pipeline.
@@ -115,30 +163,26 @@ class ActionController:
         Args:
             direction: -1: up, +1: down.
         """
+        actions = self.state.actions
         row = self.w.get_selected_action_row()
         new_row = row + direction
-        if 0 <= new_row < len(self.state.actions):
-            if self.state.actions[new_row].action_id in PROTECTED_ACTION_IDS:
+        if 0 <= new_row < len(actions):
+            if actions[new_row].action_id in PROTECTED_ACTION_IDS:
                 return
             self.state.push_undo()
             self.state.pipeline_dirty = True
-            self.state.actions[row], self.state.actions[new_row] = self.state.actions[new_row], self.state.actions[row]
-            self.state.data_states.truncate(min(row, new_row))
-            for action in self.state.actions[min(row, new_row) :]:
-                if not action.is_custom:
-                    action.reset()
+            actions[row], actions[new_row] = actions[new_row], actions[row]
+            self.state.invalidate_from(min(row, new_row), max(row, new_row) + 1, keep_custom=True)
             self.w.update_action_list()
             self.w.set_selected_action_row(new_row)
-            self.w.update_button_states()
 
     def on_action_clicked(self):
         """Respond to an action item being clicked in the list."""
         row = self.w.get_selected_action_row()
         if row < 0:
             return
-        self.w.update_button_states()
         self.w.viz_panel.current_step = row + 1
-        self.w.update_visualization()
+        self.step_change_timer.start()
 
     def show_action_context_menu(self, pos):
         """Show a right-click context menu for the action item at the given position.
@@ -153,38 +197,13 @@ class ActionController:
         if not isinstance(row, int) or row < 0:
             return
         self.w.set_selected_action_row(row)
+        self.context_row = row
 
-        menu = QMenu(self.w)
-        global_pos = self.w.action_list.viewport().mapToGlobal(pos)
-
-        edit_action = menu.addAction("Edit Settings...")
-        edit_action.triggered.connect(lambda: self.on_action_double_clicked())
-
-        menu.addSeparator()
-
-        run_single_action = menu.addAction("Run This")
-        run_single_action.triggered.connect(self.w.runner.run_single)
-
-        run_to_action = menu.addAction("Run This and Above")
-        run_to_action.triggered.connect(self.w.runner.run_to_selected)
-
-        action = self.state.actions[row]
-        if action.result is not None:
-            menu.addSeparator()
-            view_results_action = menu.addAction("View Results")
-            view_results_action.triggered.connect(lambda: self.w.open_action_results(row))
-
-        menu.addSeparator()
+        has_results = self.state.actions[row].result is not None
+        self.results_separator.setVisible(has_results)
+        self.view_results_action.setVisible(has_results)
 
-        export_action = menu.addAction("Export data at this step...")
-        export_action.triggered.connect(lambda: self.w.files.export_file(row))
-
-        menu.addSeparator()
-
-        remove_action = menu.addAction("Remove")
-        remove_action.triggered.connect(self.remove_action)
-
-        menu.popup(global_pos)
+        self.context_menu.popup(self.w.action_list.viewport().mapToGlobal(pos))
 
     def on_action_double_clicked(self):
         """Open the action editor when the user double-clicks an action."""
@@ -192,30 +211,29 @@ class ActionController:
         if row >= 0:
             self.edit_action(row)
 
-    def on_manual_code_edit(self, code: str):
-        """Buffer a manual code edit and start the debounce timer.
+    def on_manual_code_edit(self):
+        """Record a manual code edit and start the debounce timer.
 
-        The edit is not applied immediately but after a short delay.
-
-        Args:
-            code: Current editor content after the edit.
+        The edit is not applied immediately but after a short delay; the editor content is read back only then,
+        so a burst of keystrokes costs a single copy of the script.
         """
         if self.code_edit_timer is None:
             self.code_edit_timer = QTimer()
             self.code_edit_timer.setSingleShot(True)
             self.code_edit_timer.timeout.connect(self.apply_manual_code_edit)
-        self.pending_code = code
+        self.code_edit_pending = True
         self.code_edit_timer.start(500)
 
     def apply_manual_code_edit(self):
-        """Apply the buffered code edit to the action list.
+        """Apply the pending code edit to the action list.
 
         Performs a minimal diff: only actions whose id, params, or code actually changed are reset, and data_states
         are trimmed from the first changed index onward.
         """
-        if self.pending_code is None:
+        if not self.code_edit_pending:
             return
-        code: str = self.pending_code
+        self.code_edit_pending = False
+        code = self.w.code_panel.get_code()
         new_actions = parse_script_to_actions(code)
         changed = False
         first_changed_idx: int | None = None
@@ -262,15 +280,17 @@ class ActionController:
             if first_changed_idx is None:
                 first_changed_idx = 0
             self.state.push_undo()
-            self.state.data_states.truncate(first_changed_idx)
-            for action in self.state.actions[first_changed_idx:]:
-                action.reset()
+            self.state.invalidate_from(first_changed_idx)
 
         self.state.custom_preamble = extract_custom_preamble(code, self.state.actions)
 
         if changed:
             self.w.mark_pipeline_dirty()
             logger.info("Applied manual code edits; action list updated")
+            self.list_refresh_timer.start(0)
+
+    def refresh_action_list(self):
+        """Refresh the action list after code edits without regenerating the code panel."""
         self.w.update_action_list(sync_code=False)
 
     def edit_action(self, row: int):
@@ -322,8 +342,5 @@ class ActionController:
 
             if not action.is_custom:
                 action.reset()
-            self.state.data_states.truncate(row)
-            for a in self.state.actions[row:]:
-                if not a.is_custom:
-                    a.reset()
+            self.state.invalidate_from(row, keep_custom=True)
             self.w.update_action_list()
@@ -7,13 +7,14 @@ the open file is modified externally.
 
 from __future__ import annotations
 
-import hashlib
 import logging
+import os
 from pathlib import Path
 
 from typing import TYPE_CHECKING
 
-from PyQt6.QtWidgets import QFileDialog, QMessageBox
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QDialog, QFileDialog, QMessageBox
 
 import mne
 
@@ -27,6 +28,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+MAX_RECENT_FILES = 10
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write data to path via a temporary sibling file and an atomic rename.
+
+    A crash or full disk mid-write leaves the previous file intact instead of a truncated script.
+    """
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
 
 class FileHandler:
     """Handles all file I/O operations for the preprocessing window.
@@ -38,6 +51,26 @@ class FileHandler:
         self.w = window
         self.state = window.state
 
+        # QSettings writes are flushed once after a burst of recent-file updates
+        self.settings_sync_timer = QTimer(window)
+        self.settings_sync_timer.setSingleShot(True)
+        self.settings_sync_timer.timeout.connect(self.state.settings.sync)
+
+        # (st_mtime_ns, st_size) of the pipeline file as last written or read by this handler
+        self.last_file_stat: tuple[int, int] | None = None
+
+        # Created on first use and kept, so later opens skip dialog setup and start in the last directory
+        self.open_dialog: QFileDialog | None = None
+
+    def remember_file_stat(self, path: Path) -> None:
+        """Record the on-disk stamp of path so an unchanged file is not re-read by reload_pipeline."""
+        try:
+            st = path.stat()
+        except OSError:
+            self.last_file_stat = None
+            return
+        self.last_file_stat = (st.st_mtime_ns, st.st_size)
+
     def close_file(self):
         """Close the loaded EEG file and reset state and UI to their initial conditions."""
 
@@ -59,7 +92,7 @@ class FileHandler:
     def add_recent_file(self, path: str):
         """Add a file path to the head of the recent-files list and persist it.
 
-        Deduplicates and trims the list to 10 entries.
+        Deduplicates and trims the list to MAX_RECENT_FILES entries.
 
         Args:
             path: Absolute file path to record.
@@ -67,11 +100,12 @@ class FileHandler:
         if not path:
             return
         path = str(Path(path))
-        if path in self.state.recent_fif:
-            self.state.recent_fif.remove(path)
-        self.state.recent_fif.insert(0, path)
-        self.state.recent_fif = self.state.recent_fif[:10]
+        if self.state.recent_fif and self.state.recent_fif[0] == path:
+            return
+        # dict.fromkeys keeps first-seen order, so the new path moves to the head without a separate remove
+        self.state.recent_fif = list(dict.fromkeys([path, *self.state.recent_fif]))[:MAX_RECENT_FILES]
         self.state.settings.setValue("recent_fif", self.state.recent_fif)
+        self.settings_sync_timer.start(1000)
 
     def refresh_recent_menu(self):
         """No-op: recent menu is rebuilt lazily via MainWindow's aboutToShow signal."""
@@ -109,6 +143,7 @@ class FileHandler:
             return
         action = self.state.actions[0]
         action.status = ActionStatus.COMPLETE
+        self.state.status_end = max(self.state.status_end, 1)
         if not self.state.data_states:
             self.state.data_states.append(raw.copy())
         else:
@@ -194,13 +229,17 @@ class FileHandler:
 
     def open_file(self):
         """Open a file-picker dialog and load the selected EEG file."""
-        path, _ = QFileDialog.getOpenFileName(
-            self.w.window(), "Open EEG File", "", open_file_dialog_filter()
-        )
-        if not path:
+        if self.open_dialog is None:
+            self.open_dialog = QFileDialog(self.w.window(), "Open EEG File", "", open_file_dialog_filter())
+            self.open_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+            self.open_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        if self.open_dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        paths = self.open_dialog.selectedFiles()
+        if not paths:
             return
 
-        self.load_data_path(path)
+        self.load_data_path(paths[0])
 
     def export_file(self, row: int = None):
         """Export the last computed raw object to a FIF file chosen via dialog."""
@@ -283,12 +322,15 @@ class FileHandler:
             if not fp:
                 return self.save_pipeline()
         try:
-            fp.write_text(code, encoding="utf-8")
+            # Encode once: the same bytes are written and hashed
+            data = code.encode("utf-8")
+            write_bytes_atomic(fp, data)
+            self.remember_file_stat(fp)
             if self.w.project_context:
                 ctx = self.w.project_context
                 ctx.session.has_custom_pipeline = True
                 ctx.project.save(ctx.project_dir)
-            self.w.code_panel.file_hash = hashlib.md5(code.encode()).hexdigest()
+            self.w.code_panel.update_file_hash(code, data)
             self.state.pipeline_filepath = fp
             self.w.clear_pipeline_dirty()
             self.w.code_panel.set_file(fp)
@@ -313,7 +355,8 @@ class FileHandler:
 
         try:
             code = generate_full_script(self.state.actions, extra_preamble=self.state.custom_preamble or None)
-            Path(path).write_text(code)
+            write_bytes_atomic(Path(path), code.encode("utf-8"))
+            self.remember_file_stat(Path(path))
         except Exception as exc:
             logger.exception("Failed to save pipeline")
             QMessageBox.critical(self.w.window(), "Save Failed", f"Could not save pipeline:\n{exc}")
@@ -332,7 +375,8 @@ class FileHandler:
             path: Absolute path to the Python pipeline script.
         """
         try:
-            code = Path(path).read_text(encoding="utf-8")
+            code = Path(path).read_bytes().decode("utf-8")
+            self.remember_file_stat(Path(path))
             self.state.actions = parse_script_to_actions(code)
             self.state.custom_preamble = extract_custom_preamble(code, self.state.actions)
             self.state.pipeline_filepath = Path(path)
@@ -354,30 +398,47 @@ class FileHandler:
             return
         self.load_pipeline_file(path)
 
-    def reload_pipeline(self):
-        """Reload the pipeline from the currently open file, discarding computed states."""
-        if not self.state.pipeline_filepath or not self.state.pipeline_filepath.exists():
-            return
+    def reload_pipeline(self) -> bool:
+        """Reload the pipeline from the currently open file, discarding computed states.
+
+        Does nothing when the file's mtime and size still match what this handler last wrote or read.
+
+        Returns:
+            True if the pipeline was reloaded, False if it was skipped or could not be read.
+        """
+        fp = self.state.pipeline_filepath
+        if not fp:
+            return False
+        try:
+            st = fp.stat()
+        except OSError:
+            return False
+        if (st.st_mtime_ns, st.st_size) == self.last_file_stat:
+            return False
         try:
-            code = self.state.pipeline_filepath.read_text()
+            code = fp.read_bytes().decode("utf-8")
             actions = parse_script_to_actions(code)
         except Exception as exc:
-            logger.exception("Failed to reload pipeline from %s", self.state.pipeline_filepath)
+            logger.exception("Failed to reload pipeline from %s", fp)
             QMessageBox.warning(
                 self.w, "Reload Failed",
                 f"Could not reload pipeline:\n{exc}\n\nThe current session state is unchanged.",
             )
-            return
+            return False
+        self.last_file_stat = (st.st_mtime_ns, st.st_size)
         self.state.actions = actions
         self.state.custom_preamble = extract_custom_preamble(code, actions)
         self.state.data_states.clear()
         self.w.update_action_list(sync_code=False)
         self.w.code_panel.set_code(code)
         self.w.emit_status("Reloaded from file")
+        return True
 
     def on_external_code_change(self):
         """Handle the pipeline file being modified externally."""
-        self.reload_pipeline()
-        self.w.emit_status("Reloaded from disk", 3000)
+        reloaded = self.reload_pipeline()
         self.w.code_panel.pending_external_change = False
+        if not reloaded:
+            return
+        self.w.emit_status("Reloaded from disk", 3000)
         logger.info("Auto-reloaded pipeline after external file change")
@@ -1,12 +1,13 @@
 """Pipeline execution for the main window.
 
-PipelineRunner orchestrates running actions, manages QThread workers for non-interactive processing,
+PipelineRunner orchestrates running actions, submits non-interactive processing to a persistent QThreadPool,
 and handles cancellation.
 """
 
 from __future__ import annotations
 
 import logging
+from concurrent.futures import Future
 from pathlib import Path
 from typing import TYPE_CHECKING, TypeVar
 
@@ -17,8 +18,8 @@ if TYPE_CHECKING:
 
 _T = TypeVar("_T")
 
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtWidgets import QApplication, QMessageBox, QProgressDialog
+from PyQt6.QtCore import QEventLoop, QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QMessageBox, QProgressDialog
 
 from mnetape.actions.registry import get_action_by_id, get_action_title
 from mnetape.core.executor import exec_action
@@ -30,22 +31,68 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Delay for coalescing action-row refreshes during a run
+ROW_REFRESH_MS = 50
+
 
 class OperationCancelled(Exception):
     """Raised when a long-running operation is canceled by the user."""
 
 
+class TaskSignals(QObject):
+    """Signal emitter for PipelineTask, since QRunnable is not a QObject."""
+
+    done = pyqtSignal()
+
+
+class PipelineTask(QRunnable):
+    """Runnable wrapping one callable submitted through PipelineRunner.run_in_thread().
+
+    The outcome is delivered through future, which re-raises the callable's exception from result(). Cancelling
+    the future before a pool thread picks the task up skips fn entirely.
+    """
+
+    def __init__(self, fn: Callable[[], Any]):
+        super().__init__()
+        # Keep ownership on the Python side so the future can be read after run() returns
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.future: Future = Future()
+        self.signals = TaskSignals()
+
+    def run(self):
+        try:
+            if not self.future.set_running_or_notify_cancel():
+                return
+            try:
+                self.future.set_result(self.fn())
+            except BaseException as e:
+                self.future.set_exception(e)
+        finally:
+            self.signals.done.emit()
+
+
 class PipelineRunner:
     """Orchestrates action execution for the main window.
 
-    All heavy processing runs inside a QThread via run_in_thread().
+    All heavy processing runs on a single-thread QThreadPool via run_in_thread(), so the worker thread is reused
+    across steps and submissions stay sequential.
     """
 
     def __init__(self, window: "PreprocessingPage") -> None:
         self.w = window
         self.state = window.state
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(1)
+        # Rows whose status changed during a run, refreshed together when row_refresh_timer fires
+        self.dirty_rows: set[int] = set()
+        self.row_refresh_timer = QTimer(window)
+        self.row_refresh_timer.setSingleShot(True)
+        self.row_refresh_timer.setInterval(ROW_REFRESH_MS)
+        self.row_refresh_timer.timeout.connect(self.flush_dirty_rows)
         self.current_toast = None
         self.last_warnings: list[str] = []
+        self.prerequisite_warnings: list[str] = []
 
     # -------- Helpers --------
 
@@ -70,10 +117,33 @@ class PipelineRunner:
         self.current_toast = toast
         toast.show()
 
+    def modal_errors(self) -> bool:
+        """Return whether errors are reported in message boxes rather than the status bar."""
+        return self.state.settings.value("dialogs/modal_errors", True, type=bool)
+
+    def notify(self, title: str, text: str) -> None:
+        """Report a one-button warning as a message box, or in the status bar when modal errors are turned off."""
+        if self.modal_errors():
+            QMessageBox.warning(self.w, title, text)
+        else:
+            self.w.emit_status(f"{title}: {text}", 5000)
+
+    def mark_row_dirty(self, row: int) -> None:
+        """Queue a refresh of the action row at row, coalesced with other marks within ROW_REFRESH_MS."""
+        self.dirty_rows.add(row)
+        if not self.row_refresh_timer.isActive():
+            self.row_refresh_timer.start()
+
+    def flush_dirty_rows(self) -> None:
+        """Refresh every queued action row in a single pass over the list."""
+        if self.dirty_rows:
+            rows, self.dirty_rows = self.dirty_rows, set()
+            self.w.refresh_action_rows(rows)
+
     def require_data(self) -> bool:
-        """Show a warning and return False when no EEG file is loaded."""
+        """Report a warning and return False when no EEG file is loaded."""
         if self.state.raw_original is None:
-            QMessageBox.warning(self.w, "No Data", "Load an EEG file first.")
+            self.notify("No Data", "Load an EEG file first.")
             return False
         return True
 
@@ -123,20 +193,48 @@ class PipelineRunner:
                 return stored.copy()
         return self.state.raw_original.copy()
 
-    def store_action_result(self, row, data):
+    def checkpoint_key(self, row, action_def, call_site: str, func_defs: str) -> int | None:
+        """Return the key identifying the checkpoint that running call_site at row would produce.
+
+        The key chains the previous checkpoint's key with the executed code, so it only matches when every step up
+        to row ran the same code. Returns None for load_file, interactive actions and unkeyed predecessors.
+        """
+        if row == 0 or (action_def and action_def.interactive_runner):
+            return None
+        prev_key = self.state.data_states.key_at(row - 1)
+        if prev_key is None:
+            return None
+        return hash((prev_key, call_site, func_defs))
+
+    def append_action_result(self, data, key=None):
+        """Store the processed data object as the next pipeline position.
+
+        This is the common case of a run continuing right after the last stored checkpoint.
+
+        Args:
+            data: The processed data object to store.
+            key: Optional checkpoint key from checkpoint_key().
+        """
+        self.state.data_states.append(data)
+        if key is not None:
+            self.state.data_states.set_key(len(self.state.data_states) - 1, key)
+
+    def store_action_result(self, row, data, key=None):
         """Store the processed data object at the given pipeline position.
 
-        Pads data_states with copies of raw_original (for RAW positions) or None
+        Pads data_states with raw_original (for RAW positions) or None
         if needed so the list is contiguous up to row.
 
         Args:
             row: Index where the result should be stored.
             data: The processed data object to store.
+            key: Optional checkpoint key from checkpoint_key().
         """
         while len(self.state.data_states) < row:
             pad_index = len(self.state.data_states)
             pad_type = self.get_data_type_at(pad_index)
             if pad_type == DataType.RAW:
+                # Copied: raw_original can still be changed in place (stored montage, channel renames)
                 self.state.data_states.append(self.state.raw_original.copy())
             else:
                 self.state.data_states.append(None)
@@ -144,23 +242,54 @@ class PipelineRunner:
             self.state.data_states[row] = data
         else:
             self.state.data_states.append(data)
+        if key is not None:
+            self.state.data_states.set_key(row, key)
 
-    def check_prerequisites(self, action_idx: int) -> bool:
-        """Check if all prerequisite actions have been run, prompting if not."""
-        action = self.state.actions[action_idx]
-        action_def = get_action_by_id(action.action_id)
+    def claim_input(self, row: int, data):
+        """Return data in a form the action at row may mutate in place.
+
+        data is passed through unless something else still references it: raw_original is always copied, and the
+        cached checkpoint of row - 1 is released from the DataStore when a disk file backs it, or copied otherwise.
+        """
+        if data is None:
+            return None
+        if data is self.state.raw_original:
+            return data.copy()
+        store = self.state.data_states
+        if row > 0 and store.cache.get(row - 1) is data and not store.release(row - 1):
+            return data.copy()
+        return data
+
+    def check_prerequisites(self, action_idx: int, action_def=None, completed_ids: set[str] | None = None) -> bool:
+        """Check if all prerequisite actions have been run, prompting if not.
+
+        Only missing blocking prerequisites prompt. Messages of missing non-blocking ones are collected in
+        prerequisite_warnings, to be shown on the action's completion toast.
+
+        Args:
+            action_idx: Index of the action about to run.
+            action_def: The action's ActionDefinition when the caller already resolved it.
+            completed_ids: IDs of the completed actions before action_idx, when the caller tracks them.
+        """
+        self.prerequisite_warnings = []
+        if action_def is None:
+            action_def = get_action_by_id(self.state.actions[action_idx].action_id)
         if not action_def or not action_def.prerequisites:
             return True
 
-        preceding = self.state.actions[:action_idx]
-        completed_ids = {
-            a.action_id for a in preceding if a.status == ActionStatus.COMPLETE
-        }
+        if completed_ids is None:
+            completed_ids = {
+                a.action_id for a in self.state.actions[:action_idx] if a.status == ActionStatus.COMPLETE
+            }
 
         warnings: list[str] = []
         for prereq in action_def.prerequisites:
-            if prereq.action_id not in completed_ids:
+            if prereq.action_id in completed_ids:
+                continue
+            if prereq.blocking:
                 warnings.append(prereq.message)
+            else:
+                self.prerequisite_warnings.append(prereq.message)
 
         if not warnings:
             return True
@@ -189,23 +318,8 @@ class PipelineRunner:
         return row <= len(self.state.data_states)
 
     def run_in_thread(self, fn: Callable[[], _T], message: str = "Processing...") -> _T:
-        """Execute a callable in a background QThread with a cancellable progress dialog."""
-        result: list[Any] = [None]
-        error: list[BaseException | None] = [None]
-        cancel_requested = [False]
-
-        class _Worker(QThread):
-            done = pyqtSignal()
-
-            def run(self):
-                try:
-                    if self.isInterruptionRequested():
-                        return
-                    result[0] = fn()
-                except BaseException as e:
-                    error[0] = e
-                finally:
-                    self.done.emit()
+        """Execute a callable on the runner's thread pool with a cancellable progress dialog."""
+        cancel_requested = False
 
         progress = QProgressDialog(message, "Cancel", 0, 0, self.w)
         progress.setWindowModality(Qt.WindowModality.WindowModal)
@@ -216,31 +330,37 @@ class PipelineRunner:
         progress.setValue(0)
         progress.show()
 
-        worker = _Worker()
-        worker.start()
-        while worker.isRunning():
-            QApplication.processEvents()
-            if progress.wasCanceled() and not cancel_requested[0]:
-                cancel_requested[0] = True
-                self.w.emit_status("Cancelling...")
-                progress.setCancelButtonText("Cancelling...")
-                progress.setCancelButton(None)
-                worker.requestInterruption()
-            if cancel_requested[0]:
-                break
-            worker.wait(25)
+        task = PipelineTask(fn)
+        loop = QEventLoop()
+        task.signals.done.connect(loop.quit)
+
+        def on_canceled():
+            nonlocal cancel_requested
+            cancel_requested = True
+            self.w.emit_status("Cancelling...")
+            progress.setCancelButtonText("Cancelling...")
+            task.future.cancel()
+            loop.quit()
+
+        progress.canceled.connect(on_canceled)
+        self.pool.start(task)
+        # done may already have fired if the task finished before the loop started
+        if not task.future.done():
+            loop.exec()
+        progress.canceled.disconnect(on_canceled)
         progress.close()
 
-        if cancel_requested[0]:
-            if not worker.wait(500):
+        if cancel_requested:
+            if not self.pool.waitForDone(500):
                 logger.warning("Worker thread still running after cancel; it will complete in background")
             self.w.emit_status("Operation cancelled.")
             raise OperationCancelled("Operation cancelled.")
-        if worker.isRunning() and not worker.wait(200):
-            raise RuntimeError("Background worker did not finish cleanly.")
-        if error[0]:
-            raise error[0]
-        return result[0]
+        return task.future.result()
+
+    def shutdown(self) -> None:
+        """Wait briefly for a task still running on the pool, e.g. one left behind by a cancel."""
+        if not self.pool.waitForDone(500):
+            logger.warning("Worker thread still running at shutdown")
 
     def execute_action(self, action, action_def, call_site: str, func_defs: str, data,
                        input_type: DataType = DataType.RAW, output_type: DataType = DataType.RAW):
@@ -314,8 +434,7 @@ class PipelineRunner:
         if starts_with_load_file:
             fp = first_action.params.get("file_path", "")
             if not fp:
-                QMessageBox.warning(self.w, "No File Path",
-                                    "No file path set in the Load File action. Edit it first.")
+                self.notify("No File Path", "No file path set in the Load File action. Edit it first.")
                 return
         elif not self.require_data():
             return
@@ -349,7 +468,8 @@ class PipelineRunner:
         """Run a contiguous range of pipeline actions.
 
         Executes actions from start_idx up to (but not including) end_idx,
-        accumulating data states and updating the UI after each action.
+        accumulating data states. Each finished action only queues a refresh of its own row (see
+        mark_row_dirty); the action list and code panel are synchronized once when the run ends.
 
         Args:
             start_idx: Index of the first action to run.
@@ -359,38 +479,45 @@ class PipelineRunner:
         self.w.emit_status("Running pipeline...")
         logger.info("======== Running actions %d to %d ========", start_idx, end_idx)
 
+        # Copies are deferred to claim_input(), which only makes one when the input is still shared
         if start_idx > 0 and self.state.data_states:
-            stored = self.state.data_states[start_idx - 1]
-            if stored is None:
+            data = self.state.data_states[start_idx - 1]
+            if data is None:
                 logger.warning(
                     "Checkpoint at index %d is unavailable; falling back to raw_original", start_idx - 1
                 )
-            data = stored.copy() if stored is not None else self.state.raw_original.copy()
-            del stored  # release the DataStore reference, only copy is needed
-            # Pop from LRU cache
-            self.state.data_states.cache.pop(start_idx - 1, None)
-        elif self.state.raw_original is not None:
-            data = self.state.raw_original.copy()
+                data = self.state.raw_original
         else:
-            data = None  # load_file at index 0 will populate this
+            data = self.state.raw_original  # None until load_file at index 0 populates it
+
+        # Grown as the loop completes actions, so prerequisite checks never rescan the list
+        completed_ids = {
+            a.action_id for a in self.state.actions[:start_idx] if a.status == ActionStatus.COMPLETE
+        }
 
-        QApplication.processEvents()
+        # Declared type flowing into the current action, advanced as the loop goes instead of re-walked per action
+        context_type = self.get_data_type_at(start_idx)
 
         # Drop the viz panel's reference to the previous checkpoint so it can be freed
         self.w.viz_panel.current_data = None
 
         for i in range(start_idx, min(end_idx, len(self.state.actions))):
             action = self.state.actions[i]
+            # Any status set below lands on this index
+            self.state.status_end = max(self.state.status_end, i + 1)
             title = get_action_title(action)
+            # Painted by the event loop run_in_thread() or an interactive dialog spins; no processEvents() re-entry
             self.w.emit_status(f"Running: {title}...")
             logger.info("-------- Running action %d: %s --------", i + 1, title)
-            QApplication.processEvents()
 
-            if not self.check_prerequisites(i):
+            action_def = get_action_by_id(action.action_id)
+            step_context_type = context_type
+            if action_def and action_def.output_type != DataType.ANY:
+                context_type = action_def.output_type
+            if not self.check_prerequisites(i, action_def, completed_ids):
                 final_status = "Pipeline stopped (missing prerequisites)"
                 break
 
-            action_def = get_action_by_id(action.action_id)
             in_type = action_def.input_type if action_def else DataType.RAW
             out_type = action_def.output_type if action_def else DataType.RAW
 
@@ -400,7 +527,6 @@ class PipelineRunner:
                 if data is None:
                     action.status = ActionStatus.ERROR
                     action.error_msg = "No input data available."
-                    self.w.update_action_list(sync_code=False)
                     final_status = f"Pipeline stopped: no data for action {i + 1}"
                     break
 
@@ -421,12 +547,14 @@ class PipelineRunner:
                     )
                     logger.error("Type mismatch at action %d: pipeline=%s action_input=%s",
                                  i + 1, pipeline_type, in_type)
-                    self.w.update_action_list(sync_code=False)
                     final_status = f"Pipeline stopped: type mismatch at action {i + 1}"
                     break
 
             # Interactive runner hook
             if action_def and action_def.interactive_runner:
+                # The runner may modify its input, so it gets a private copy
+                if not is_load_file:
+                    data = self.claim_input(i, data)
                 try:
                     data = action_def.interactive_runner.run(action, data, self.w)
                 except OperationCancelled:
@@ -437,30 +565,56 @@ class PipelineRunner:
                     action.status = ActionStatus.ERROR
                     action.error_msg = str(e)
                     logger.exception("Interactive runner failed at index %d: %s", i, title)
-                    QMessageBox.critical(self.w, "Error", f"{title} failed:\n{e}")
-                    final_status = f"Pipeline failed at action {i + 1}: {title}"
+                    if self.modal_errors():
+                        QMessageBox.critical(self.w, "Error", f"{title} failed:\n{e}")
+                    final_status = f"Pipeline failed at action {i + 1}: {title} ({e})"
                     break
 
             try:
-                call_site, func_defs = self.w.get_execution_code(i, action)
-                data = self.execute_action(action, action_def, call_site, func_defs, data,
-                                           input_type=in_type, output_type=out_type)
-                if is_load_file:
-                    # Sync state so subsequent actions and visualization see the loaded data
-                    self.state.raw_original = data
-                    fp = action.params.get("file_path", "")
-                    if fp:
-                        self.state.data_filepath = Path(fp)
-                    self.w.files.apply_stored_montage_if_present()
-                self.store_action_result(i, data)
+                call_site, func_defs = self.w.get_execution_code(i, action, step_context_type)
+                key = self.checkpoint_key(i, action_def, call_site, func_defs)
+                reused = None
+                if key is not None and self.state.data_states.reclaim(i, key):
+                    reused = self.state.data_states[i]
+                    if reused is None:
+                        # Retired checkpoint could not be read back; drop it and run normally
+                        self.state.data_states.set_key(i, None)
+                        self.state.data_states.truncate(i)
+                from_checkpoint = reused is not None
+                if from_checkpoint:
+                    # Left cached; the next step's claim_input() releases or copies it
+                    data = reused
+                    del reused
+                else:
+                    # Claimed only now: a reclaimed checkpoint needs no private copy of its input
+                    if not is_load_file and not (action_def and action_def.interactive_runner):
+                        data = self.claim_input(i, data)
+                    data = self.execute_action(action, action_def, call_site, func_defs, data,
+                                               input_type=in_type, output_type=out_type)
+                    if is_load_file:
+                        # Sync state so subsequent actions and visualization see the loaded data
+                        self.state.raw_original = data
+                        fp = action.params.get("file_path", "")
+                        if fp:
+                            self.state.data_filepath = Path(fp)
+                        self.w.files.apply_stored_montage_if_present()
+                    if i == len(self.state.data_states):
+                        self.append_action_result(data, key)
+                    else:
+                        self.store_action_result(i, data, key)
                 action.status = ActionStatus.COMPLETE
+                completed_ids.add(action.action_id)
                 if action_def.result_builder_fn:
                     try:
                         action.result = action_def.result_builder_fn(data)
                     except Exception as e:
                         logger.warning("Result builder failed for %s: %s", title, e, exc_info=True)
-                self.show_toast(action, title, warnings=self.last_warnings or None)
-                logger.info("Completed action %d: %s", i + 1, title)
+                if from_checkpoint:
+                    logger.info("Reused checkpoint for action %d: %s", i + 1, title)
+                else:
+                    toast_warnings = self.prerequisite_warnings + self.last_warnings
+                    self.show_toast(action, title, warnings=toast_warnings or None)
+                    logger.info("Completed action %d: %s", i + 1, title)
             except OperationCancelled:
                 action.status = ActionStatus.PENDING
                 logger.info("Cancelled while running action %d: %s", i + 1, title)
@@ -470,12 +624,18 @@ class PipelineRunner:
                 action.status = ActionStatus.ERROR
                 action.error_msg = str(e)
                 logger.exception("Action failed at index %d: %s", i, title)
-                QMessageBox.critical(self.w, "Error", f"{title} failed:\n{e}")
-                final_status = f"Pipeline failed at action {i + 1}: {title}"
+                if self.modal_errors():
+                    QMessageBox.critical(self.w, "Error", f"{title} failed:\n{e}")
+                final_status = f"Pipeline failed at action {i + 1}: {title} ({e})"
                 break
 
-            self.w.update_action_list()
+            # Only this row's status changed; the full list and code sync runs once after the loop
+            self.mark_row_dirty(i)
 
+        # The full sync below covers any rows still queued
+        self.row_refresh_timer.stop()
+        self.dirty_rows.clear()
+        self.w.update_action_list()
         self.w.viz_panel.current_step = min(end_idx, len(self.state.data_states))
         self.w.update_visualization()
         self.w.emit_status(final_status)
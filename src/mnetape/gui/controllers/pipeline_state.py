@@ -6,7 +6,6 @@ All GUI controllers read and write the same object, so any update is immediately
 
 from __future__ import annotations
 
-import copy
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -34,6 +33,8 @@ class PipelineState:
         pipeline_filepath: Absolute path of the currently open pipeline script, or None.
         settings: Persistent QSettings instance for saving preferences across sessions.
         recent_fif: Ordered list of recently opened EEG file paths (most recent first).
+        status_end: Exclusive bound on the action indices that may hold a non-pending status. Raised by the
+            runner as it executes actions and lowered by invalidate_from.
     """
 
     raw_original: mne.io.Raw | None = None
@@ -48,10 +49,15 @@ class PipelineState:
     custom_preamble: list[str] = field(default_factory=list)
     pipeline_dirty: bool = False
     pipeline_modified_this_session: bool = False
+    status_end: int = 0
+
+    def snapshot_actions(self) -> list[ActionConfig]:
+        """Return a configuration-only copy of the actions list for the undo/redo stacks."""
+        return [a.config_copy() for a in self.actions]
 
     def push_undo(self) -> None:
         """Snapshot the current actions list onto the undo stack and clear redo."""
-        self.undo_stack.append(copy.deepcopy(self.actions))
+        self.undo_stack.append(self.snapshot_actions())
         if len(self.undo_stack) > MAX_UNDO:
             self.undo_stack.pop(0)
         self.redo_stack.clear()
@@ -60,16 +66,55 @@ class PipelineState:
         """Pop the most recent undo snapshot; push current state to redo."""
         if not self.undo_stack:
             return None
-        self.redo_stack.append(copy.deepcopy(self.actions))
+        self.redo_stack.append(self.snapshot_actions())
         return self.undo_stack.pop()
 
     def pop_redo(self) -> list[ActionConfig] | None:
         """Pop the most recent redo snapshot; push current state to undo."""
         if not self.redo_stack:
             return None
-        self.undo_stack.append(copy.deepcopy(self.actions))
+        self.undo_stack.append(self.snapshot_actions())
         return self.redo_stack.pop()
 
+    def invalidate_from(self, row: int, end: int | None = None, *, keep_custom: bool = False) -> None:
+        """Drop checkpoints from row onward and reset the actions whose results are now stale.
+
+        Only actions below status_end can carry a status, result or error, so the already-pending tail of the
+        pipeline is skipped instead of being reset again on every edit.
+
+        Args:
+            row: Index of the first action whose input changed.
+            end: Exclusive upper bound of positions touched by a reorder, so a moved action is reset even when it
+                lands past status_end.
+            keep_custom: When True, actions with user-edited code keep their status.
+        """
+        stale_end = min(max(self.status_end, end or 0), len(self.actions))
+        self.data_states.truncate(row)
+        kept_end = row
+        for i in range(row, stale_end):
+            action = self.actions[i]
+            if keep_custom and action.is_custom:
+                kept_end = i + 1
+                continue
+            action.reset()
+        self.status_end = min(self.status_end, kept_end)
+
+    def restore_actions(self, snapshot: list[ActionConfig]) -> None:
+        """Replace the action list with an undo/redo snapshot, keeping the unchanged prefix intact.
+
+        Leading actions whose configuration matches the snapshot keep their status and checkpoints. Everything
+        from the first difference onward is invalidated, so the dropped checkpoints can be reclaimed by the runner.
+
+        Args:
+            snapshot: Action list popped from the undo or redo stack.
+        """
+        first = next(
+            (i for i, (old, new) in enumerate(zip(self.actions, snapshot)) if not old.same_config(new)),
+            min(len(self.actions), len(snapshot)),
+        )
+        self.actions = self.actions[:first] + snapshot[first:]
+        self.invalidate_from(first, len(self.actions))
+
     @classmethod
     def create(cls) -> "PipelineState":
         """Construct an PipelineState and restore the recent files list from QSettings.
@@ -4,10 +4,12 @@ ActionEditor is a QDialog that builds a form from an action's params_schema, an
 and a live code-preview panel. It supports both full-action editing and step-level editing.
 """
 
+import functools
 import json
 import logging
+from typing import Any, Callable
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QFontMetrics
 from PyQt6.Qsci import QsciLexerPython, QsciScintilla
 from PyQt6.QtWidgets import (
@@ -41,6 +43,11 @@ from mnetape.gui.widgets import create_code_editor
 
 logger = logging.getLogger(__name__)
 
+# Quiet period after the last widget edit before the code preview is regenerated
+PREVIEW_DEBOUNCE_MS = 75
+
+# Generated previews remembered per dialog, keyed by the repr of the primary params
+MAX_PREVIEW_CACHE = 32
 
 # -------- Widget creation helpers --------
 
@@ -72,14 +79,7 @@ class NullableWidget(QWidget):
         self.checkbox.toggled.connect(self.on_toggle)
         self.checkbox.toggled.connect(lambda _: self.value_changed.emit())
 
-        if isinstance(inner, (QSpinBox, QDoubleSpinBox)):
-            inner.valueChanged.connect(self.value_changed)
-        elif isinstance(inner, QComboBox):
-            inner.currentTextChanged.connect(self.value_changed)
-        elif isinstance(inner, QCheckBox):
-            inner.stateChanged.connect(self.value_changed)
-        elif isinstance(inner, QLineEdit):
-            inner.textChanged.connect(self.value_changed)
+        connect_widget_signal(inner, self.value_changed)
 
         layout.addWidget(self.checkbox)
         layout.addWidget(inner, 1)
@@ -134,6 +134,7 @@ def create_widget_for_param(param_def: dict, current_value):
 
     if ptype == "float":
         widget = QDoubleSpinBox()
+        widget.blockSignals(True)
         widget.setRange(param_def.get("min", -999999), param_def.get("max", 999999))
         widget.setDecimals(param_def.get("decimals", 2))
         widget.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.UpDownArrows)
@@ -145,6 +146,7 @@ def create_widget_for_param(param_def: dict, current_value):
 
     elif ptype == "int":
         widget = QSpinBox()
+        widget.blockSignals(True)
         widget.setRange(param_def.get("min", -999999), param_def.get("max", 999999))
         widget.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.UpDownArrows)
         try:
@@ -155,12 +157,14 @@ def create_widget_for_param(param_def: dict, current_value):
 
     elif ptype == "choice":
         widget = QComboBox()
+        widget.blockSignals(True)
         widget.addItems(param_def.get("choices", []))
         widget.setCurrentText(str(display_value))
         inner = widget
 
     elif ptype == "bool":
         widget = QCheckBox()
+        widget.blockSignals(True)
         widget.setChecked(bool(display_value))
         inner = widget
 
@@ -179,11 +183,52 @@ def create_widget_for_param(param_def: dict, current_value):
         widget = QLineEdit(str(display_value) if display_value is not None else "")
         inner = widget
 
+    # Spin boxes, combos and checkboxes are configured with signals blocked; nothing is connected yet
+    widget.blockSignals(False)
+
     if nullable:
         return NullableWidget(inner, has_value=(current_value is not None))
     return widget
 
 
+# Value getter and value-changed signal per built-in param widget type, looked up by exact type first
+VALUE_GETTERS: dict[type, Callable[[QWidget], Any]] = {
+    QSpinBox: QSpinBox.value,
+    QDoubleSpinBox: QDoubleSpinBox.value,
+    QComboBox: QComboBox.currentText,
+    QCheckBox: QCheckBox.isChecked,
+    QLineEdit: QLineEdit.text,
+}
+VALUE_SIGNALS: dict[type, Callable[[QWidget], Any]] = {
+    QSpinBox: lambda w: w.valueChanged,
+    QDoubleSpinBox: lambda w: w.valueChanged,
+    QComboBox: lambda w: w.currentTextChanged,
+    QCheckBox: lambda w: w.stateChanged,
+    QLineEdit: lambda w: w.textChanged,
+}
+
+
+def lookup_by_type(table: dict[type, Callable], widget):
+    """Return the table entry for the widget's exact type, falling back to the first matching base class."""
+    fn = table.get(type(widget))
+    if fn is not None:
+        return fn
+    for cls, candidate in table.items():
+        if isinstance(widget, cls):
+            return candidate
+    return None
+
+
+def value_signal(widget):
+    """Return the bound value-changed signal of a param widget, or None for unrecognized widget types."""
+    if isinstance(widget, NullableWidget):
+        return widget.value_changed
+    fn = lookup_by_type(VALUE_SIGNALS, widget)
+    if fn is not None:
+        return fn(widget)
+    return getattr(widget, "value_changed", None)
+
+
 def get_widget_value(widget):
     """Extract the current value from a param widget.
 
@@ -193,18 +238,14 @@ def get_widget_value(widget):
     Returns:
         The widget's current value in its native Python type, or None for unrecognized widget types.
     """
+    fn = VALUE_GETTERS.get(type(widget))
+    if fn is not None:
+        return fn(widget)
     # Custom get_value() takes priority over built-in type detection
     if hasattr(widget, "get_value") and callable(widget.get_value):
         return widget.get_value()
-    if isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-        return widget.value()
-    if isinstance(widget, QComboBox):
-        return widget.currentText()
-    if isinstance(widget, QCheckBox):
-        return widget.isChecked()
-    if isinstance(widget, QLineEdit):
-        return widget.text()
-    return None
+    fn = lookup_by_type(VALUE_GETTERS, widget)
+    return fn(widget) if fn is not None else None
 
 
 def connect_widget_signal(widget, slot):
@@ -214,18 +255,22 @@ def connect_widget_signal(widget, slot):
         widget: A Qt widget created by create_widget_for_param.
         slot: Callable to invoke whenever the widget's value changes.
     """
-    if isinstance(widget, NullableWidget):
-        widget.value_changed.connect(slot)
-    elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-        widget.valueChanged.connect(slot)
-    elif isinstance(widget, QComboBox):
-        widget.currentTextChanged.connect(slot)
-    elif isinstance(widget, QCheckBox):
-        widget.stateChanged.connect(slot)
-    elif isinstance(widget, QLineEdit):
-        widget.textChanged.connect(slot)
-    elif hasattr(widget, "value_changed"):
-        widget.value_changed.connect(slot)
+    signal = value_signal(widget)
+    if signal is not None:
+        signal.connect(slot)
+
+
+@functools.cache
+def preview_fonts() -> tuple[QFont, QFont, int]:
+    """Return the code preview font, its bold keyword variant and its line height.
+
+    Built on first use rather than at import, since fonts need a running QApplication.
+    """
+    font = QFont("Consolas", 10)
+    font.setFixedPitch(True)
+    kw_font = QFont(font)
+    kw_font.setBold(True)
+    return font, kw_font, QFontMetrics(font).height()
 
 
 # -------- Main dialog --------
@@ -260,6 +305,13 @@ class ActionEditor(QDialog):
         self.context_type = context_type
         self.action_def = get_action_by_id(action.action_id)
 
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self.preview_timer.timeout.connect(self.refresh_code_preview)
+        self.last_preview_code: str | None = None
+        self.preview_cache: dict[str, str] = {}
+
         self.setWindowTitle(f"Edit: {get_action_title(action)}")
         _managed = (
             set(self.action_def.interactive_runner.managed_params)
@@ -323,7 +375,7 @@ class ActionEditor(QDialog):
         self.custom_was_reset = False
         if action.is_custom and action.action_id != CUSTOM_ACTION_ID:
             self.custom_warning = QLabel("⚠ This action has custom code. Editing parameters will reset it.")
-            self.custom_warning.setStyleSheet("color: orange; margin-bottom: 10px;")
+            self.custom_warning.setObjectName("action_editor_custom_warning")
             layout.addWidget(self.custom_warning)
 
             self.btn_reset_custom = QPushButton("Reset to Original")
@@ -345,46 +397,43 @@ class ActionEditor(QDialog):
         # Show action docstring if available
         doc_label = QLabel(self.action_def.doc if self.action_def else "")
         doc_label.setWordWrap(True)
-        doc_label.setStyleSheet("color: gray; margin-bottom: 10px;")
+        doc_label.setObjectName("action_editor_doc")
         layout.addWidget(doc_label)
 
         # Primary params
         self.form = QFormLayout()
         self.visible_params = visible_params
         self.param_rows: dict[str, int] = {}
-        row_idx = 0
+        form = self.form
+        form_labels = self.action_def.form_labels if self.action_def else {}
+        factories = self.action_def.widget_factories if self.action_def else {}
+        current_params = action.params
+        param_widgets = self.param_widgets
+        param_rows = self.param_rows
 
-        for param_name, param_def in visible_params.items():
-            current_value = action.params.get(param_name, param_def.get("default"))
-            desc = param_def.get("description", "")
+        for row_idx, (param_name, param_def) in enumerate(visible_params.items()):
+            current_value = current_params.get(param_name, param_def.get("default"))
 
             # Look up a custom widget factory by param name
-            binding = next((b for b in self.action_def.widget_bindings if b.param_name == param_name), None)
-            factory = binding.factory if binding else None
+            factory = factories.get(param_name) if factories else None
             custom = factory(current_value, self.raw, self) if factory else None
             if custom is not None:
-                container, value_widget = custom
-                self.param_widgets[param_name] = value_widget
+                field_widget, value_widget = custom
+                param_widgets[param_name] = value_widget
                 if self.raw is None:
-                    for btn in container.findChildren(QPushButton):
+                    for btn in field_widget.findChildren(QPushButton):
                         if not btn.isEnabled() and not btn.toolTip():
                             btn.setToolTip("Run the previous steps first.")
-                self.form.addRow(param_def.get("label", param_name) + ":", container)
-                field_widget = container
             else:
-                widget = create_widget_for_param(param_def, current_value)
-                self.param_widgets[param_name] = widget
-                self.form.addRow(param_def.get("label", param_name) + ":", widget)
-                field_widget = widget
+                field_widget = create_widget_for_param(param_def, current_value)
+                param_widgets[param_name] = field_widget
 
-            if desc:
+            label = QLabel(form_labels[param_name])
+            if desc := param_def.get("description"):
                 field_widget.setToolTip(desc)
-                label = self.form.labelForField(field_widget)
-                if label:
-                    label.setToolTip(desc)
-
-            self.param_rows[param_name] = row_idx
-            row_idx += 1
+                label.setToolTip(desc)
+            form.addRow(label, field_widget)
+            param_rows[param_name] = row_idx
 
         layout.addLayout(self.form)
 
@@ -405,6 +454,7 @@ class ActionEditor(QDialog):
         self.advanced_specs: dict[str, dict[str, dict]] = {}  # func_name -> {param: spec}
         self.advanced_group_box: QGroupBox | None = None
         self.advanced_toggle_btn: QPushButton | None = None
+        self.advanced_built = False
         self.build_advanced_section(layout)
         layout.addStretch()
 
@@ -419,20 +469,16 @@ class ActionEditor(QDialog):
         self.code_preview.setReadOnly(True)
         self.code_preview.setMarginWidth(0, 0)
         self.code_preview.setCaretLineVisible(False)
-        preview_font = QFont("Consolas", 10)
-        preview_font.setFixedPitch(True)
+        preview_font, kw_font, self._preview_line_h = preview_fonts()
         self.code_preview.setFont(preview_font)
         lexer = self.code_preview.lexer()
         if lexer:
             for i in range(128):
                 lexer.setFont(preview_font, i)
-            kw_font = QFont(preview_font)
-            kw_font.setBold(True)
             lexer.setFont(kw_font, QsciLexerPython.Keyword)
-        self._preview_line_h = QFontMetrics(preview_font).height()
         self.code_preview.SendScintilla(QsciScintilla.SCI_SETSCROLLWIDTHTRACKING, 1)
         self.code_preview.SendScintilla(QsciScintilla.SCI_SETSCROLLWIDTH, 1)
-        self.update_code_preview()
+        self.refresh_code_preview()
         bottom_layout.addWidget(self.code_preview)
 
         # MNE doc links
@@ -454,20 +500,41 @@ class ActionEditor(QDialog):
         bottom_layout.addWidget(buttons)
 
     def build_advanced_section(self, parent_layout: QVBoxLayout):
-        """Build the collapsible advanced params section."""
+        """Build the collapsible advanced params section.
+
+        Only the toggle button and an empty group box are created here. The per-param widgets are built by
+        populate_advanced_section(), either right away when the action already has advanced params or on the
+        first expansion.
+        """
 
         if not self.action_def or not self.action_def.advanced_schema:
             return
 
-        all_advanced = self.action_def.advanced_schema
-
         self.advanced_toggle_btn = QPushButton("Show Advanced")
         self.advanced_toggle_btn.setCheckable(True)
         parent_layout.addWidget(self.advanced_toggle_btn)
 
         group_box = QGroupBox("Advanced")
         self.advanced_group_box = group_box
-        adv_layout = QVBoxLayout(group_box)
+        QVBoxLayout(group_box)
+        parent_layout.addWidget(group_box)
+
+        has_advanced = bool(self.action.advanced_params)
+        if has_advanced:
+            self.populate_advanced_section()
+        group_box.setVisible(has_advanced)
+        self.advanced_toggle_btn.setChecked(has_advanced)
+        self.advanced_toggle_btn.setText("Hide Advanced" if has_advanced else "Show Advanced")
+        self.advanced_toggle_btn.toggled.connect(self.on_toggle_advanced)
+
+    def populate_advanced_section(self):
+        """Create the advanced param widgets inside the group box, once."""
+        if self.advanced_built or self.advanced_group_box is None:
+            return
+        self.advanced_built = True
+
+        all_advanced = self.action_def.advanced_schema
+        adv_layout = self.advanced_group_box.layout()
 
         for group_name, adv_params in all_advanced.items():
             if len(all_advanced) > 1:
@@ -479,33 +546,28 @@ class ActionEditor(QDialog):
             self.advanced_specs[group_name] = {}
 
             existing_advanced = self.action.advanced_params.get(group_name, {})
+            labels = self.action_def.advanced_form_labels[group_name]
 
             for pname, pdef in adv_params.items():
                 current = existing_advanced.get(pname, pdef.get("default"))
                 widget = create_widget_for_param(pdef, current)
                 self.advanced_widgets[group_name][pname] = widget
                 self.advanced_specs[group_name][pname] = pdef
-                func_form.addRow(pdef.get("label", pname) + ":", widget)
+                func_form.addRow(labels[pname], widget)
                 connect_widget_signal(widget, self.update_code_preview)
 
             adv_layout.addLayout(func_form)
 
-        parent_layout.addWidget(group_box)
-
-        has_advanced = bool(self.action.advanced_params)
-        group_box.setVisible(has_advanced)
-        self.advanced_toggle_btn.setChecked(has_advanced)
-        self.advanced_toggle_btn.setText("Hide Advanced" if has_advanced else "Show Advanced")
-        self.advanced_toggle_btn.toggled.connect(self.on_toggle_advanced)
-
     def on_toggle_advanced(self, checked: bool):
-        """Show or hide the advanced params group box.
+        """Show or hide the advanced params group box, building its widgets on first show.
 
         Args:
             checked: True when the section should be visible.
         """
         if self.advanced_group_box is None or self.advanced_toggle_btn is None:
             return
+        if checked:
+            self.populate_advanced_section()
         self.advanced_group_box.setVisible(checked)
         self.advanced_toggle_btn.setText("Hide Advanced" if checked else "Show Advanced")
 
@@ -517,7 +579,7 @@ class ActionEditor(QDialog):
         self.action.custom_code = ""
         self.action.is_custom = False
         self.action.status = ActionStatus.PENDING
-        self.update_code_preview()
+        self.refresh_code_preview()
         if self.custom_warning:
             self.custom_warning.hide()
         if self.btn_reset_custom:
@@ -535,7 +597,10 @@ class ActionEditor(QDialog):
         return params
 
     def get_advanced_params(self) -> dict:
-        """Return advanced params grouped by group name, only non-default values."""
+        """Return advanced params grouped by group name, only non-default values.
+
+        Until the advanced section has been built, no widget can hold a non-default value, so the result is empty.
+        """
 
         kwargs_targets = self.action_def.kwargs_targets if self.action_def else {}
         if not kwargs_targets:
@@ -544,16 +609,16 @@ class ActionEditor(QDialog):
         result: dict[str, dict] = {}
         for group_name, widgets in self.advanced_widgets.items():
             group_params: dict = {}
+            specs = self.advanced_specs[group_name]
             for pname, widget in widgets.items():
                 value = get_widget_value(widget)
 
-                pdef = self.advanced_specs.get(group_name, {}).get(pname, {})
+                pdef = specs[pname]
                 default = pdef.get("default")
 
                 # For nullable text params, keep empty input as None so that untouched fields won't get emitted as kwargs
-                if isinstance(widget, QLineEdit):
-                    if value == "" and (pdef.get("nullable") or default is None):
-                        value = None
+                if value == "" and pdef.get("type", "text") == "text" and (pdef.get("nullable") or default is None):
+                    value = None
 
                 if value != default:
                     group_params[pname] = value
@@ -564,21 +629,47 @@ class ActionEditor(QDialog):
         return result
 
     def update_code_preview(self):
+        """Schedule a code preview refresh, coalescing bursts of widget edits into one regeneration."""
+        self.preview_timer.start()
+
+    def refresh_code_preview(self):
         """Regenerate the code preview from current widget values."""
+        self.preview_timer.stop()
         if self.action.is_custom and self.action.custom_code:
             code = self.action.custom_code
         else:
-            temp_action = ActionConfig(
-                self.action.action_id,
-                self.get_params(),
-                advanced_params=self.get_advanced_params(),
-            )
-            code = generate_action_code(temp_action, self.context_type)
-        self.code_preview.setText(code)
+            # The preview is the function definition only: advanced params never change it, and primary params
+            # only select the body variant, so identical params always render identical code.
+            params = self.get_params()
+            key = repr(params)
+            code = self.preview_cache.get(key)
+            if code is None:
+                code = generate_action_code(ActionConfig(self.action.action_id, params), self.context_type)
+                if len(self.preview_cache) >= MAX_PREVIEW_CACHE:
+                    # Drop the oldest entry; dicts keep insertion order
+                    del self.preview_cache[next(iter(self.preview_cache))]
+                self.preview_cache[key] = code
+        if code == self.last_preview_code:
+            return
+        self.last_preview_code = code
+
+        self.code_preview.setUpdatesEnabled(False)
+        self.code_preview.blockSignals(True)
+        try:
+            self.code_preview.setText(code)
+        finally:
+            self.code_preview.blockSignals(False)
+            self.code_preview.setUpdatesEnabled(True)
         lines = max(code.count("\n") + 1, 1)
         new_h = min(lines * self._preview_line_h + 10, 150)
         self.code_preview.setFixedHeight(new_h)
 
+    def accept(self):
+        """Flush any pending preview refresh before closing the dialog."""
+        if self.preview_timer.isActive():
+            self.refresh_code_preview()
+        super().accept()
+
     def get_params(self) -> dict:
         """Return primary parameter values, including managed params preserved from action.params.
 
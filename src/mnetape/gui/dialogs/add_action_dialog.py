@@ -16,7 +16,7 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
-from mnetape.actions.registry import get_action_by_id, list_actions
+from mnetape.actions.registry import list_actions
 from mnetape.core.models import CUSTOM_ACTION_ID
 
 # Action IDs not listed here are collected into "Other".
@@ -28,6 +28,9 @@ CATEGORIES: dict[str, list[str]] = {
     "ICA": ["ica_fit", "ica_apply"],
 }
 
+# Item data role holding the action's description, read back when the selection changes
+DOC_ROLE = Qt.ItemDataRole.UserRole + 1
+
 
 class AddActionDialog(QDialog):
     """Modal dialog for picking an action type to add to the pipeline.
@@ -72,6 +75,7 @@ class AddActionDialog(QDialog):
                 action_def = all_actions[action_id]
                 child = QTreeWidgetItem(cat_item, [action_def.title])
                 child.setData(0, Qt.ItemDataRole.UserRole, action_id)
+                child.setData(0, DOC_ROLE, action_def.doc)
                 if first_action_item is None:
                     first_action_item = child
                 assigned.add(action_id)
@@ -85,6 +89,7 @@ class AddActionDialog(QDialog):
             for action_def in remaining:
                 child = QTreeWidgetItem(cat_item, [action_def.title])
                 child.setData(0, Qt.ItemDataRole.UserRole, action_def.action_id)
+                child.setData(0, DOC_ROLE, action_def.doc)
                 if first_action_item is None:
                     first_action_item = child
             cat_item.setExpanded(True)
@@ -98,7 +103,7 @@ class AddActionDialog(QDialog):
         # Description label
         self.desc_label = QLabel()
         self.desc_label.setWordWrap(True)
-        self.desc_label.setStyleSheet("color: gray;")
+        self.desc_label.setObjectName("add_action_description")
         self.desc_label.setFixedHeight(40)
         self.desc_label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
         self.update_description()
@@ -128,13 +133,8 @@ class AddActionDialog(QDialog):
     def update_description(self):
         """Refresh the description label for the currently highlighted action."""
         item = self.action_tree.currentItem()
-        if item:
-            action_id = item.data(0, Qt.ItemDataRole.UserRole)
-            if action_id:
-                action_def = get_action_by_id(action_id)
-                self.desc_label.setText(action_def.doc if action_def else "")
-                return
-        self.desc_label.setText("")
+        doc = item.data(0, DOC_ROLE) if item else None
+        self.desc_label.setText(doc or "")
 
     def get_action_id(self) -> str | None:
         """Return the action_id of the currently selected item, or None."""
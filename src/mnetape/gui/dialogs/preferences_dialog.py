@@ -107,6 +107,26 @@ class PreferencesDialog(QDialog):
 
         layout.addWidget(qc_group)
 
+        # ---- Dialogs ----
+        dialogs_group = QGroupBox("Dialogs")
+        dialogs_form = QFormLayout(dialogs_group)
+        dialogs_form.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapLongRows)
+
+        self.modal_errors_check = QCheckBox("Show errors in message boxes")
+        self.modal_errors_check.setChecked(
+            self.settings.value("dialogs/modal_errors", True, type=bool)
+        )
+        modal_errors_hint = QLabel(
+            "When unchecked, failed actions and missing data are reported in the status bar "
+            "without interrupting the pipeline."
+        )
+        modal_errors_hint.setWordWrap(True)
+        modal_errors_hint.setStyleSheet("color: gray; font-size: 11px;")
+        dialogs_form.addRow(self.modal_errors_check)
+        dialogs_form.addRow("", modal_errors_hint)
+
+        layout.addWidget(dialogs_group)
+
         buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
         )
@@ -127,5 +147,6 @@ class PreferencesDialog(QDialog):
 
         self.settings.setValue("qc/auto_generate", self.qc_auto_check.isChecked())
         self.settings.setValue("qc/events_viewer_enabled", self.qc_events_check.isChecked())
+        self.settings.setValue("dialogs/modal_errors", self.modal_errors_check.isChecked())
 
         self.accept()
@@ -11,6 +11,7 @@ from PyQt6.QtCore import QSettings
 from PyQt6.QtGui import QAction, QKeySequence
 from PyQt6.QtWidgets import QLabel, QMainWindow, QMenu, QStackedWidget, QStatusBar
 
+from mnetape.gui.controllers.file_handler import MAX_RECENT_FILES
 from mnetape.gui.pages.project_page import ProjectPage
 from mnetape.gui.pages.preprocessing_page import PreprocessingPage
 
@@ -163,6 +164,10 @@ class MainWindow(QMainWindow):
 
         self.prep_recent_menu = QMenu("Open Recent", self)
         self.prep_recent_menu.aboutToShow.connect(self.refresh_prep_recent_menu)
+        self.prep_recent_menu.triggered.connect(self.on_prep_recent_triggered)
+        self.prep_recent_empty = self.prep_recent_menu.addAction("No recent files")
+        self.prep_recent_empty.setEnabled(False)
+        self.prep_recent_actions = [self.prep_recent_menu.addAction("") for _ in range(MAX_RECENT_FILES)]
         prep_file.addMenu(self.prep_recent_menu)
 
         close_file = QAction("Close File", self)
@@ -209,7 +214,7 @@ class MainWindow(QMainWindow):
 
         pipeline_menu.addSeparator()
         run_all = QAction("Run All", self)
-        run_all.setShortcut(QKeySequence("Ctrl+Shift+Return"))
+        run_all.setShortcuts([QKeySequence("Ctrl+Shift+Return"), QKeySequence("Ctrl+Return")])
         run_all.triggered.connect(lambda: self.prep_page and self.prep_page.runner.run_all())
         pipeline_menu.addAction(run_all)
 
@@ -225,18 +230,20 @@ class MainWindow(QMainWindow):
                 action.setVisible(page == "prep")
 
     def refresh_prep_recent_menu(self):
-        """Rebuild the prep recent-files menu from the current prep page state."""
-        self.prep_recent_menu.clear()
+        """Relabel the pre-built prep recent-files entries from the current prep page state."""
         recent = self.prep_page.state.recent_fif if self.prep_page is not None else []
-        if not recent:
-            a = QAction("No recent files", self)
-            a.setEnabled(False)
-            self.prep_recent_menu.addAction(a)
-            return
-        for path in recent:
-            act = QAction(path, self)
-            act.triggered.connect(lambda _, p=path: self.prep_page and self.prep_page.files.load_data_path(p))
-            self.prep_recent_menu.addAction(act)
+        self.prep_recent_empty.setVisible(not recent)
+        for i, act in enumerate(self.prep_recent_actions):
+            path = recent[i] if i < len(recent) else None
+            act.setText(path or "")
+            act.setData(path)
+            act.setVisible(path is not None)
+
+    def on_prep_recent_triggered(self, action: QAction):
+        """Load the recent file stored on the triggered menu entry."""
+        path = action.data()
+        if path and self.prep_page is not None:
+            self.prep_page.files.load_data_path(path)
 
     # -------- Page switching --------
 
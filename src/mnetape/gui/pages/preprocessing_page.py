@@ -18,7 +18,7 @@ if TYPE_CHECKING:
     from mnetape.gui.pages.project_page import ProjectPage
 
 import mne
-from PyQt6.QtCore import QEvent, QSettings, Qt, QUrl, pyqtSignal
+from PyQt6.QtCore import QEvent, QSettings, Qt, QUrl, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QBrush, QColor, QDesktopServices, QKeySequence, QShortcut
 from PyQt6.QtWidgets import (
     QApplication,
@@ -34,8 +34,14 @@ from PyQt6.QtWidgets import (
 )
 
 from mnetape.actions.registry import get_action_by_id, get_action_title
-from mnetape.core.codegen import extract_custom_preamble, generate_full_script, parse_script_to_actions, pipeline_canonical_code
-from mnetape.core.models import CUSTOM_ACTION_ID, DataType, ICASolution
+from mnetape.core.codegen import (
+    cached_call_site,
+    extract_custom_preamble,
+    generate_full_script,
+    parse_script_to_actions,
+    pipeline_canonical_code,
+)
+from mnetape.core.models import CUSTOM_ACTION_ID, ActionConfig, DataType, ICASolution
 from mnetape.core.project import ParticipantStatus, ProjectContext, STATUS_COLORS, STATUS_LABELS
 from mnetape.gui.controllers.action_controller import ActionController, PROTECTED_ACTION_IDS
 from mnetape.gui.controllers.file_handler import FileHandler
@@ -52,6 +58,8 @@ logger = logging.getLogger(__name__)
 FUNCS_HEADER_RE = re.compile(r"^#\s*---\s*Functions\s*---[ \t]*$", re.MULTILINE)
 PIPE_HEADER_RE = re.compile(r"^#\s*---\s*Pipeline\s*---[ \t]*$", re.MULTILINE)
 BLOCK_HEADER_RE = re.compile(r"^#\s*\[\d+\]\s*(.+)$", re.MULTILINE)
+LOAD_FILE_DEF_RE = re.compile(r"^\s*def\s+load_file(?:_\d+)?\s*\(", re.MULTILINE)
+LOAD_FILE_CALL_RE = re.compile(r"\braw\s*=\s*load_file(?:_\d+)?\s*\(")
 
 
 def remove_func_def_from_text(text: str, func_name: str) -> str:
@@ -106,9 +114,35 @@ def renumber_action_blocks(pipe_text: str) -> str:
     return BLOCK_HEADER_RE.sub(repl, pipe_text)
 
 
+def script_signature(actions: list[ActionConfig], preamble: list[str]) -> tuple:
+    """Return a hashable snapshot of everything generate_full_script reads from the actions and preamble.
+
+    Params are captured by repr() since they may hold lists or dicts.
+    """
+    return tuple(preamble), tuple(
+        (a.action_id, repr(a.params), repr(a.advanced_params), a.custom_code, a.is_custom, a.title_override)
+        for a in actions
+    )
+
+
+def type_header_text(data_type: DataType) -> str:
+    """Return the label of the action-list section header for data_type."""
+    return f"── {data_type.label} ──"
+
+
+def action_needs_inspection(action: ActionConfig, action_def) -> bool:
+    """Return True when the action's interactive runner requires manual inspection before running."""
+    return (
+        action_def is not None
+        and action_def.interactive_runner is not None
+        and action_def.interactive_runner.needs_inspection is not None
+        and action_def.interactive_runner.needs_inspection(action)
+    )
+
+
 def make_type_header(data_type: DataType) -> QListWidgetItem:
     """Create a section header item for the given data type."""
-    header = QListWidgetItem(f"── {data_type.label} ──")
+    header = QListWidgetItem(type_header_text(data_type))
     header.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
     header.setForeground(QBrush(QColor("#888888")))
     font = header.font()
@@ -168,6 +202,17 @@ class PreprocessingPage(QWidget):
         self.open_dialogs: list = []
         self.generate_qc_after_pipeline = False
 
+        # Enabled states last applied to the move-up, move-down, undo and redo buttons
+        self.button_states: tuple[bool, bool, bool, bool] | None = None
+
+        # Signature and text of the script last pushed by update_code
+        self.code_signature: tuple | None = None
+        self.pushed_code = ""
+        # Set whenever the action list is resynced; cleared once update_code has run
+        self.code_dirty = True
+        # Script text last scanned for load_file, with (has_function, has_call_site)
+        self.load_file_scan: tuple[str, tuple[bool, bool]] | None = None
+
         # Helpers
         self.files = FileHandler(self)
         self.runner = PipelineRunner(self)
@@ -253,7 +298,7 @@ class PreprocessingPage(QWidget):
         self.btn_prev.setFixedSize(32, 28)
         self.btn_prev.setEnabled(False)
         self.btn_prev.setToolTip("Previous run")
-        self.btn_prev.clicked.connect(lambda: self.on_navigate(-1))
+        self.btn_prev.clicked.connect(self.navigate_prev)
         header_layout.addWidget(self.btn_prev)
 
         self._participant_label = QLabel()
@@ -271,7 +316,7 @@ class PreprocessingPage(QWidget):
         self.btn_next.setFixedSize(32, 28)
         self.btn_next.setEnabled(False)
         self.btn_next.setToolTip("Next run")
-        self.btn_next.clicked.connect(lambda: self.on_navigate(+1))
+        self.btn_next.clicked.connect(self.navigate_next)
         header_layout.addWidget(self.btn_next)
 
         header_layout.addStretch()
@@ -366,6 +411,8 @@ class PreprocessingPage(QWidget):
         self.action_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.action_list.customContextMenuRequested.connect(self.action_ctrl.show_action_context_menu)
         self.action_list.items_reordered.connect(self.action_ctrl.move_action_to)
+        self.action_list.run_requested.connect(self.runner.run_action_at)
+        self.action_list.currentRowChanged.connect(self.on_current_row_changed)
         delete_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Delete), self.action_list)
         delete_shortcut.setContext(Qt.ShortcutContext.WidgetShortcut)
         delete_shortcut.activated.connect(self.action_ctrl.remove_action)
@@ -375,13 +422,13 @@ class PreprocessingPage(QWidget):
 
         self.btn_move_up = QPushButton("\u25b2")
         self.btn_move_up.setFixedWidth(40)
-        self.btn_move_up.clicked.connect(lambda: self.action_ctrl.move_action(-1))
+        self.btn_move_up.clicked.connect(self.move_selected_up)
         self.btn_move_up.setEnabled(False)
         move_btns.addWidget(self.btn_move_up)
 
         self.btn_move_down = QPushButton("\u25bc")
         self.btn_move_down.setFixedWidth(40)
-        self.btn_move_down.clicked.connect(lambda: self.action_ctrl.move_action(1))
+        self.btn_move_down.clicked.connect(self.move_selected_down)
         self.btn_move_down.setEnabled(False)
         move_btns.addWidget(self.btn_move_down)
 
@@ -428,12 +475,12 @@ class PreprocessingPage(QWidget):
         self.btn_viz = QPushButton("Visualization")
         self.btn_viz.setCheckable(True)
         self.btn_viz.setChecked(True)
-        self.btn_viz.clicked.connect(lambda: self.set_view_mode("viz"))
+        self.btn_viz.clicked.connect(self.show_viz_view)
         toggle_layout.addWidget(self.btn_viz)
 
         self.btn_code = QPushButton("Code")
         self.btn_code.setCheckable(True)
-        self.btn_code.clicked.connect(lambda: self.set_view_mode("code"))
+        self.btn_code.clicked.connect(self.show_code_view)
         toggle_layout.addWidget(self.btn_code)
 
         toggle_layout.addStretch()
@@ -449,8 +496,8 @@ class PreprocessingPage(QWidget):
 
         self.view_stack.addWidget(self.viz_panel)
 
-        self.code_panel.on_external_change = self.files.on_external_code_change
-        self.code_panel.on_manual_edit = self.action_ctrl.on_manual_code_edit
+        self.code_panel.external_change.connect(self.files.on_external_code_change)
+        self.code_panel.manual_edit.connect(self.action_ctrl.on_manual_code_edit)
         self.view_stack.addWidget(self.code_panel)
 
         right_layout.addWidget(self.view_stack)
@@ -555,6 +602,7 @@ class PreprocessingPage(QWidget):
         self.status_label.setText(f"Status: {label}")
         self.status_label.setStyleSheet(f"color: {color}; font-size: 11px; font-weight: bold;")
 
+    @pyqtSlot()
     def set_default_pipeline_stub(self, *, confirm: bool = True):
         """Forward set-default-pipeline to the project page via the window."""
         win = self.window()
@@ -562,6 +610,7 @@ class PreprocessingPage(QWidget):
         if project_page is not None:
             project_page.pipeline_ctrl.set_default_pipeline(confirm=confirm)
 
+    @pyqtSlot()
     def use_default_pipeline_stub(self):
         """Forward use-default-pipeline to the project page via the window."""
         win = self.window()
@@ -571,9 +620,6 @@ class PreprocessingPage(QWidget):
 
     def setup_shortcuts(self):
         """Register global keyboard shortcuts not covered by menu accelerators."""
-        shortcut = QShortcut(QKeySequence("Ctrl+Return"), self)
-        shortcut.activated.connect(self.runner.run_all)
-
         undo_shortcut = QShortcut(QKeySequence.StandardKey.Undo, self)
         undo_shortcut.activated.connect(self.undo_pipeline)
 
@@ -609,6 +655,14 @@ class PreprocessingPage(QWidget):
 
     # -------- Toggle between code/viz --------
 
+    @pyqtSlot()
+    def show_viz_view(self):
+        self.set_view_mode("viz")
+
+    @pyqtSlot()
+    def show_code_view(self):
+        self.set_view_mode("code")
+
     def set_view_mode(self, mode: str):
         """Switch the right panel between visualization and code editor."""
         if mode == "viz":
@@ -624,12 +678,15 @@ class PreprocessingPage(QWidget):
     # -------- UI update --------
 
     def update_action_list(self, sync_code: bool = True):
-        """Rebuild the action list widget and synchronize dependent UI elements."""
-        self.action_list.clear()
+        """Sync the action list widget with state.actions and synchronize dependent UI elements.
 
-        pipeline_type = DataType.RAW
-        self.action_list.addItem(make_type_header(pipeline_type))
+        Existing row widgets are reconfigured in place (see sync_action_items) rather than rebuilt.
+        """
+        self.code_dirty = True
 
+        # Desired layout: (-1, header type) for section headers, (row, (action, action_def, mismatch)) for actions
+        pipeline_type = DataType.RAW
+        entries: list[tuple[int, object]] = [(-1, pipeline_type)]
         for i, action in enumerate(self.state.actions):
             action_def = get_action_by_id(action.action_id)
             input_type = action_def.input_type if action_def else DataType.RAW
@@ -639,51 +696,109 @@ class PreprocessingPage(QWidget):
                 and input_type != DataType.ANY
                 and input_type != pipeline_type
             )
-
-            needs_inspection = (
-                action_def is not None
-                and action_def.interactive_runner is not None
-                and action_def.interactive_runner.needs_inspection is not None
-                and action_def.interactive_runner.needs_inspection(action)
-            )
-
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, i)
-            widget = ActionListItem(i + 1, action, type_mismatch=is_mismatch,
-                                    needs_inspection=needs_inspection)
-            if action.action_id == "load_file":
-                widget.run_btn.setVisible(False)
-            item.setSizeHint(widget.sizeHint())
-            widget.size_changed.connect(lambda it=item, w=widget: it.setSizeHint(w.sizeHint()))
-            widget.run_clicked.connect(lambda _row, actual_row=i: self.runner.run_action_at(actual_row))
-            self.action_list.addItem(item)
-            self.action_list.setItemWidget(item, widget)
+            entries.append((i, (action, action_def, is_mismatch)))
 
             if not is_mismatch:
                 new_type = output_type
                 if new_type != DataType.ANY and new_type != pipeline_type:
                     pipeline_type = new_type
-                    self.action_list.addItem(make_type_header(pipeline_type))
+                    entries.append((-1, pipeline_type))
+
+        # Mutate with repaints and selection signals suspended; dependents are synced once afterwards
+        self.action_list.setUpdatesEnabled(False)
+        self.action_list.blockSignals(True)
+        try:
+            self.sync_action_items(entries)
+        finally:
+            self.action_list.blockSignals(False)
+            self.action_list.setUpdatesEnabled(True)
+
+        self.sync_after_action_list_update(sync_code)
+
+    def sync_action_items(self, entries: list[tuple[int, object]]) -> None:
+        """Bring the list items in line with entries, reusing the existing rows position by position.
 
+        Qt deletes an item's widget as soon as its row is removed, so widgets cannot be pooled across a clear().
+        Instead, action rows that stay action rows are reconfigured for their new action and position, header rows
+        are relabeled, and an item is only replaced where a header and an action swap places. Surplus items are
+        dropped from the tail.
+        """
+        lst = self.action_list
+        for pos, (row, payload) in enumerate(entries):
+            item = lst.item(pos)
+            if row < 0:
+                if item is not None and item.data(Qt.ItemDataRole.UserRole) == -1:
+                    text = type_header_text(payload)
+                    if item.text() != text:
+                        item.setText(text)
+                    continue
+                new_item = make_type_header(payload)
+                widget = None
+            else:
+                action, action_def, is_mismatch = payload
+                needs_inspection = action_needs_inspection(action, action_def)
+                widget = lst.itemWidget(item) if item is not None else None
+                if isinstance(widget, ActionListItem):
+                    item.setData(Qt.ItemDataRole.UserRole, row)
+                    widget.reconfigure(row + 1, action, is_mismatch, needs_inspection)
+                    widget.run_btn.setVisible(action.action_id != "load_file")
+                    continue
+                new_item = QListWidgetItem()
+                new_item.setData(Qt.ItemDataRole.UserRole, row)
+                widget = self.create_action_widget(row, action, action_def, new_item, is_mismatch)
+
+            if item is not None:
+                lst.takeItem(pos)
+            lst.insertItem(pos, new_item)
+            if widget is not None:
+                lst.setItemWidget(new_item, widget)
+
+        while lst.count() > len(entries):
+            lst.takeItem(lst.count() - 1)
+
+    def create_action_widget(
+        self, row: int, action: ActionConfig, action_def, item: QListWidgetItem, type_mismatch: bool
+    ) -> ActionListItem:
+        """Build the row widget for an action, attach it to its list item and forward its run button to the list.
+
+        The caller passes the already resolved action_def so each row costs a single registry lookup.
+        """
+        widget = ActionListItem(row + 1, action, type_mismatch=type_mismatch,
+                                needs_inspection=action_needs_inspection(action, action_def))
+        if action.action_id == "load_file":
+            widget.run_btn.setVisible(False)
+        widget.set_list_item(item)
+        widget.run_clicked.connect(self.action_list.run_requested)
+        return widget
+
+    def sync_after_action_list_update(self, sync_code: bool):
+        """Synchronize the step list, code panel, load_file warning and buttons with the action list."""
         self.viz_panel.update_step_list(self.state.actions)
         if sync_code:
             self.update_code()
-        if not self.has_load_file_function() or not self.has_load_file_call_site():
-            self.load_file_warning.setVisible(True)
-        else:
-            self.load_file_warning.setVisible(False)
+        self.load_file_warning.setVisible(not all(self.scan_load_file()))
         self.update_button_states()
 
+    def scan_load_file(self) -> tuple[bool, bool]:
+        """Return whether the code panel contains a load_file function definition and a load_file call site.
+
+        The result is cached against the script text, so repeated syncs of an unchanged script skip the regex scans.
+        """
+        code = self.code_panel.get_code()
+        if self.load_file_scan is None or self.load_file_scan[0] != code:
+            found = (bool(LOAD_FILE_DEF_RE.search(code)), bool(LOAD_FILE_CALL_RE.search(code)))
+            self.load_file_scan = (code, found)
+        return self.load_file_scan[1]
+
     def has_load_file_function(self) -> bool:
         """Return True when the code panel contains a load_file function definition."""
-        code = self.code_panel.get_code()
-        return bool(re.search(r"^\s*def\s+load_file(?:_\d+)?\s*\(", code, re.MULTILINE))
+        return self.scan_load_file()[0]
 
     def has_load_file_call_site(self) -> bool:
         """Return True when the code panel contains a load_file call site."""
-        code = self.code_panel.get_code()
-        return bool(re.search(r"\braw\s*=\s*load_file(?:_\d+)?\s*\(", code))
+        return self.scan_load_file()[1]
 
+    @pyqtSlot()
     def restore_load_file_action(self) -> None:
         """Surgically insert load_file back without regenerating the whole script.
 
@@ -780,6 +895,20 @@ class PreprocessingPage(QWidget):
         idx = item.data(Qt.ItemDataRole.UserRole)
         return idx if isinstance(idx, int) and idx >= 0 else -1
 
+    def refresh_action_rows(self, action_rows: set[int]):
+        """Re-read the title and status of the given action rows without resyncing the whole list."""
+        remaining = set(action_rows)
+        for i in range(self.action_list.count()):
+            if not remaining:
+                return
+            item = self.action_list.item(i)
+            row = item.data(Qt.ItemDataRole.UserRole) if item else None
+            if row in remaining:
+                remaining.discard(row)
+                widget = self.action_list.itemWidget(item)
+                if isinstance(widget, ActionListItem):
+                    widget.refresh()
+
     def set_selected_action_row(self, action_row: int):
         """Select the given action list item."""
         for i in range(self.action_list.count()):
@@ -788,19 +917,40 @@ class PreprocessingPage(QWidget):
                 self.action_list.setCurrentRow(i)
                 return
 
+    @pyqtSlot()
+    def move_selected_up(self):
+        self.action_ctrl.move_action(-1)
+
+    @pyqtSlot()
+    def move_selected_down(self):
+        self.action_ctrl.move_action(1)
+
+    @pyqtSlot(int)
+    def on_current_row_changed(self, _row: int):
+        self.update_button_states()
+
     def update_button_states(self):
-        """Enable or disable the move-up, move-down, undo, and redo buttons based on selection."""
+        """Enable or disable the move-up, move-down, undo, and redo buttons based on selection.
+
+        Runs on every selection change and list update, so the buttons are only touched when a state differs from
+        the one last applied.
+        """
+        actions = self.state.actions
         row = self.get_selected_action_row()
         has_selection = row >= 0
-        is_protected = has_selection and self.state.actions[row].action_id in PROTECTED_ACTION_IDS
-        above_protected = (
-            has_selection and row > 0
-            and self.state.actions[row - 1].action_id in PROTECTED_ACTION_IDS
+        is_protected = has_selection and actions[row].action_id in PROTECTED_ACTION_IDS
+        above_protected = has_selection and row > 0 and actions[row - 1].action_id in PROTECTED_ACTION_IDS
+        states = (
+            has_selection and not is_protected and not above_protected and row > 0,
+            has_selection and not is_protected and row < len(actions) - 1,
+            bool(self.state.undo_stack),
+            bool(self.state.redo_stack),
         )
-        self.btn_move_up.setEnabled(has_selection and not is_protected and not above_protected and row > 0)
-        self.btn_move_down.setEnabled(has_selection and not is_protected and row < len(self.state.actions) - 1)
-        self.btn_undo.setEnabled(bool(self.state.undo_stack))
-        self.btn_redo.setEnabled(bool(self.state.redo_stack))
+        if states == self.button_states:
+            return
+        self.button_states = states
+        for button, enabled in zip((self.btn_move_up, self.btn_move_down, self.btn_undo, self.btn_redo), states):
+            button.setEnabled(enabled)
 
     def mark_pipeline_dirty(self):
         """Mark the pipeline as having unsaved changes and show the dirty indicator."""
@@ -814,28 +964,24 @@ class PreprocessingPage(QWidget):
         self.state.pipeline_dirty = False
         self._dirty_indicator.setVisible(False)
 
+    @pyqtSlot()
     def undo_pipeline(self):
         """Restore the previous pipeline snapshot from the undo stack."""
         snapshot = self.state.pop_undo()
         if snapshot is None:
             return
-        self.state.actions = snapshot
+        self.state.restore_actions(snapshot)
         self.mark_pipeline_dirty()
-        self.state.data_states.truncate(0)
-        for action in self.state.actions:
-            action.reset()
         self.update_action_list()
 
+    @pyqtSlot()
     def redo_pipeline(self):
         """Re-apply the next pipeline snapshot from the redo stack."""
         snapshot = self.state.pop_redo()
         if snapshot is None:
             return
-        self.state.actions = snapshot
+        self.state.restore_actions(snapshot)
         self.mark_pipeline_dirty()
-        self.state.data_states.truncate(0)
-        for action in self.state.actions:
-            action.reset()
         self.update_action_list()
 
     # -------- Unsaved-changes guard --------
@@ -875,6 +1021,7 @@ class PreprocessingPage(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             self.set_default_pipeline_stub(confirm=False)
 
+    @pyqtSlot()
     def on_back_clicked(self):
         if not self.confirm_discard_if_dirty():
             return
@@ -882,6 +1029,14 @@ class PreprocessingPage(QWidget):
             self.offer_set_as_default()
         self.close_requested.emit()
 
+    @pyqtSlot()
+    def navigate_prev(self):
+        self.on_navigate(-1)
+
+    @pyqtSlot()
+    def navigate_next(self):
+        self.on_navigate(+1)
+
     def on_navigate(self, direction: int):
         if not self.confirm_discard_if_dirty():
             return
@@ -890,45 +1045,46 @@ class PreprocessingPage(QWidget):
         self.navigate_requested.emit(direction)
 
     def update_code(self):
-        """Regenerate the full pipeline script and push it to the code panel."""
+        """Regenerate the full pipeline script and push it to the code panel.
+
+        Returns immediately when the action list has not been resynced since the last call, e.g. when toggling
+        between the viz and code views. Otherwise skipped when the actions and preamble are unchanged since the
+        last push and the editor still shows that script, e.g. when only statuses changed during a pipeline run.
+        """
+        if not self.code_dirty:
+            return
+        self.code_dirty = False
+        signature = script_signature(self.state.actions, self.state.custom_preamble)
+        if signature == self.code_signature and self.code_panel.get_code() == self.pushed_code:
+            return
         code = generate_full_script(self.state.actions, extra_preamble=self.state.custom_preamble or None)
         self.code_panel.set_code(code)
+        self.code_signature = signature
+        self.pushed_code = code
+
+    def step_data(self, step: int) -> tuple:
+        """Return the data to show for step and, when that step is not computed, a label naming the fallback shown.
 
-    def fallback_data(self, step: int):
-        """Walk backward from step-1 to find the last computed data state."""
-        for i in range(step - 1, -1, -1):
-            if i == 0:
-                if self.state.raw_original is not None:
-                    return self.state.raw_original, "original"
-            elif 0 < i <= len(self.state.data_states):
-                stored = self.state.data_states[i - 1]
-                if stored is not None:
-                    data = stored.raw if isinstance(stored, ICASolution) else stored
-                    action = self.state.actions[i - 1]
-                    title = get_action_title(action)
-                    return data, f"step {i}. {title}"
-        return self.state.raw_original, "original"
+        Walks back from step to the last computed state in one pass, checking slot occupancy before reading so only
+        the state that is actually returned may be loaded from disk. Step 0 is the original recording.
+        """
+        states = self.state.data_states
+        for i in range(min(step, len(states)), 0, -1):
+            if not states.has_data(i - 1):
+                continue
+            stored = states[i - 1]
+            if stored is None:
+                continue
+            data = stored.raw if isinstance(stored, ICASolution) else stored
+            if i == step:
+                return data, None
+            return data, f"step {i}. {get_action_title(self.state.actions[i - 1])}"
+        return self.state.raw_original, (None if step == 0 else "original")
 
     def update_visualization(self):
         """Refresh the visualization panel for the currently selected pipeline step."""
         step = self.viz_panel.current_step
-
-        if step == 0:
-            data_to_show = self.state.raw_original
-            fallback_label = None
-        elif 0 < step <= len(self.state.data_states):
-            stored = self.state.data_states[step - 1]
-            if stored is None:
-                data_to_show, fallback_label = self.fallback_data(step)
-            elif isinstance(stored, ICASolution):
-                data_to_show = stored.raw
-                fallback_label = None
-            else:
-                data_to_show = stored
-                fallback_label = None
-        else:
-            data_to_show, fallback_label = self.fallback_data(step)
-
+        data_to_show, fallback_label = self.step_data(step)
         self.viz_panel.update_plots(data_to_show, step, fallback_label)
         self.update_raw_info(data_to_show)
 
@@ -954,8 +1110,12 @@ class PreprocessingPage(QWidget):
 
     # --------- Code generation and execution ---------
 
-    def get_execution_code(self, index: int, action) -> tuple[str, str]:
-        """Return (call_site, func_defs) for executing a single action."""
+    def get_execution_code(self, index: int, action, context_type: DataType | None = None) -> tuple[str, str]:
+        """Return (call_site, func_defs) for executing a single action.
+
+        context_type is the declared data type flowing into index; pass it when already known to skip the walk
+        over the preceding actions.
+        """
         if action.action_id == CUSTOM_ACTION_ID:
             return action.custom_code or "", ""
 
@@ -963,19 +1123,17 @@ class PreprocessingPage(QWidget):
         if not action_def:
             return action.custom_code or "", ""
 
-        context_type = self.runner.get_data_type_at(index)
+        if context_type is None:
+            context_type = self.runner.get_data_type_at(index)
 
+        # Shares the script generator's cache, so a run right after a code refresh renders no parameters
+        call_site = cached_call_site(action_def, action, action.action_id, context_type)
         if action.is_custom and action.custom_code:
             func_defs = action_def.build_function_def_with_body(action.action_id, action.custom_code, context_type, params=action.params)
-            params = {**action_def.default_params(), **action.params}
-            adv = action.advanced_params or None
-            call_site = action_def.build_call_site(action.action_id, params, adv, context_type)
             return call_site, func_defs
 
         params = {**action_def.default_params(), **action.params}
-        adv = action.advanced_params or None
         func_defs = action_def.build_function_def(action.action_id, context_type, params=params)
-        call_site = action_def.build_call_site(action.action_id, params, adv, context_type)
         return call_site, func_defs
 
     def open_action_results(self, row: int):
@@ -1071,6 +1229,7 @@ class PreprocessingPage(QWidget):
         raws = [mne.io.read_raw(str(p), preload=True, verbose=False) for p in paths]
         return cast(mne.io.Raw, mne.concatenate_raws(raws))
 
+    @pyqtSlot()
     def run_and_save(self):
         """Run all pipeline actions, export the final output, then mark the session preprocessed."""
         self.generate_qc_after_pipeline = True
@@ -1248,6 +1407,7 @@ class PreprocessingPage(QWidget):
         self.btn_qc_report.setVisible(True)
         self.emit_status(f"QC report saved -> {out_path.name}")
 
+    @pyqtSlot()
     def open_qc_report(self):
         """Open the QC report for the current run in the system browser."""
         path = self.get_qc_report_path()
@@ -1256,6 +1416,7 @@ class PreprocessingPage(QWidget):
 
     def cleanup(self):
         """Release resources. Called by MainWindow when the embedded session ends."""
+        self.runner.shutdown()
         self.state.data_states.close()
 
     def event(self, event: QEvent | None) -> bool:
@@ -1,30 +1,46 @@
 """Code panel for generated pipeline script viewing and editing.
 
 CodePanel wraps an editor with action-block background highlighting, a watcher that reacts to external edits,
-and callbacks that allow PreprocessingPage to handle manual edits and external file changes.
+and signals that let PreprocessingPage handle manual edits and external file changes.
 """
 
+import functools
 import hashlib
 import re
+import time
+import zlib
 from colorsys import hls_to_rgb
 from pathlib import Path
-from typing import Callable
-
-from PyQt6.QtCore import QFileSystemWatcher, QTimer
+from PyQt6.QtCore import QFileSystemWatcher, QTimer, pyqtSignal
 from PyQt6.QtGui import QColor
 from PyQt6.Qsci import QsciScintilla
 from PyQt6.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QWidget
 
+from mnetape.core.codegen import BLOCK_HEADER_RE, PIPELINE_SECTION_HEADER
 from mnetape.gui.widgets import create_code_editor
 
 # QDcintilla has a limit of 32 markers
 MAX_ACTION_MARKERS = 32
 
+# Quiet period after the last watcher notification before the file is re-read
+FILE_CHANGE_DEBOUNCE_MS = 200
+
+# Files modified this recently are always re-read, since coarse filesystem timestamps can hide a second write
+RECENT_WRITE_WINDOW_NS = 2_000_000_000
+
+# Quiet period after the last keystroke before action blocks are re-highlighted
+HIGHLIGHT_DEBOUNCE_MS = 150
+
+# The pipeline section header on a line of its own; only the text after it is split into lines
+PIPELINE_LINE_RE = re.compile(rf"^[^\S\n]*{re.escape(PIPELINE_SECTION_HEADER)}[^\S\n]*$", re.MULTILINE)
 
+
+@functools.lru_cache(maxsize=256)
 def action_name_color(name: str) -> QColor:
     """Generate a deterministic, subtle dark background tint for an action name.
 
-    Uses an MD5 hash of the name to pick a hue, then maps it to a dark, slightly saturated color.
+    Uses an MD5 hash of the name to pick a hue, then maps it to a dark, slightly saturated color. Memoized per
+    name; the returned QColor is shared and must not be modified.
 
     Args:
         name: The action title string used as the color seed.
@@ -39,26 +55,44 @@ def action_name_color(name: str) -> QColor:
     return QColor(int(r * 255), int(g * 255), int(b * 255))
 
 
+def content_hash(text: str | bytes) -> str:
+    """Return a digest of script text, or its UTF-8 bytes, for change detection.
+
+    Only compares versions of the same file, so no cryptographic strength is needed. BLAKE2b with a 16-byte
+    digest is faster than MD5 in software.
+    """
+    data = text.encode() if isinstance(text, str) else text
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 class CodePanel(QWidget):
     """Panel containing a QScintilla code editor for the pipeline script.
 
     Provides action-block background highlighting so each pipeline action's code is tinted with a unique color.
-    Monitors the backing file for external edits via QFileSystemWatcher and invokes on_external_change when a change is
+    Monitors the backing file for external edits via QFileSystemWatcher and emits external_change when a change is
     detected.
 
+    Signals:
+        external_change: The watched file changed on disk.
+        manual_edit: The user edited the editor content; read it back with get_code().
+
     Attributes:
-        editor: The QsciScintilla editor widget.
+        editor: The QsciScintilla editor widget, created the first time the panel is shown; None until then.
+        buffered_code: Latest script text while the editor does not exist yet or the panel is hidden; None when the
+            editor shows the current script.
         file_label: Label showing the name of the open pipeline file.
         current_file: Path of the file currently watched for external changes.
-        file_hash: MD5 hex digest of the last written content, used to detect changes without false positives
+        file_hash: content_hash() digest of the last written content, used to detect changes without false positives
             from filesystem events.
+        hashed_text: The text file_hash was computed from, so identical text is not encoded and hashed again.
+        file_stat: (st_mtime_ns, st_size) of current_file when it was last read, so watcher notifications that
+            leave the file untouched are dismissed with a single stat.
         pending_external_change: Set to True when the watcher detects a new hash; cleared by the caller after handling.
-        internal_update: Set to True while CodePanel itself is updating the editor content, suppressing
-            on_manual_edit callbacks.
-        on_external_change: Optional callback invoked when the watched file changes on disk.
-        on_manual_edit: Optional callback invoked with the new code string whenever the user edits the editor content.
     """
 
+    external_change = pyqtSignal()
+    manual_edit = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         layout = QVBoxLayout(self)
@@ -70,11 +104,9 @@ class CodePanel(QWidget):
 
         layout.addLayout(toolbar)
 
-        self.editor = create_code_editor(self)
-        self.editor.textChanged.connect(self.on_text_changed)
-        layout.addWidget(self.editor)
-
-        self.editor.setMarginWidth(1, 0)
+        # The QScintilla editor is built on first show; users who never open the code view never pay for it
+        self.editor: QsciScintilla | None = None
+        self.buffered_code: str | None = ""
 
         self.marker_colors: dict[str, int] = {}
         self.next_marker = 0
@@ -83,13 +115,72 @@ class CodePanel(QWidget):
         self.watcher = QFileSystemWatcher()
         self.watcher.fileChanged.connect(self.on_file_changed)
 
+        # Editors often save in several writes; coalesce the resulting notifications into one check
+        self.file_change_timer = QTimer(self)
+        self.file_change_timer.setSingleShot(True)
+        self.file_change_timer.setInterval(FILE_CHANGE_DEBOUNCE_MS)
+        self.file_change_timer.timeout.connect(self.check_file_change)
+
         self.current_file: Path | None = None
         self.file_hash: str = ""
+        self.hashed_text: str = ""
+        self.file_stat: tuple[int, int] | None = None
         self.pending_external_change = False
-        self.internal_update = False
 
-        self.on_external_change: Callable[[], None] | None = None
-        self.on_manual_edit: Callable[[str], None] | None = None
+        # Typing re-highlights once per pause instead of once per keystroke
+        self.highlight_timer = QTimer(self)
+        self.highlight_timer.setSingleShot(True)
+        self.highlight_timer.setInterval(HIGHLIGHT_DEBOUNCE_MS)
+        self.highlight_timer.timeout.connect(self.highlight_action_blocks)
+
+    def ensure_editor(self):
+        """Create the editor on first use."""
+        if self.editor is not None:
+            return
+        self.editor = create_code_editor(self)
+        self.editor.setMarginWidth(1, 0)
+        self.editor.textChanged.connect(self.on_text_changed)
+        self.layout().addWidget(self.editor)
+
+    def showEvent(self, event):
+        self.ensure_editor()
+        self.flush_buffered_code()
+        super().showEvent(event)
+
+    def flush_buffered_code(self):
+        """Load the buffered script into the editor and highlight it."""
+        if self.buffered_code is None:
+            return
+        text = self.buffered_code
+        self.buffered_code = None
+        self.set_editor_text(text)
+        self.highlight_action_blocks()
+
+    def set_editor_text(self, text: str):
+        """Put text in the editor with its signals blocked.
+
+        Blocking the editor's signals keeps programmatic updates from reaching manual_edit and skips
+        the textChanged emissions QScintilla fires for the delete and insert halves of setText.
+        """
+        self.editor.blockSignals(True)
+        self.editor.setText(text)
+        self.editor.blockSignals(False)
+
+    def show_text(self, text: str) -> bool:
+        """Put text in the editor, or buffer it while the editor does not exist or the panel is hidden.
+
+        Buffering defers QScintilla's restyling and the marker pass to the next time the code view is shown, so
+        regenerating the script while the visualization view is active only costs a string assignment.
+
+        Returns:
+            True if the editor was updated, False if the text was only buffered.
+        """
+        if self.editor is None or not self.isVisible():
+            self.buffered_code = text
+            return False
+        self.buffered_code = None
+        self.set_editor_text(text)
+        return True
 
     def set_file(self, filepath: Path):
         """Start watching filepath and load its contents into the editor.
@@ -104,61 +195,88 @@ class CodePanel(QWidget):
 
         self.current_file = filepath
 
-        if filepath.exists():
+        if self.load_file():
             self.watcher.addPath(str(filepath))
-            self.load_file()
+
+    def update_file_hash(self, text: str, encoded: bytes | None = None):
+        """Set file_hash to the digest of text, reusing the previous digest when text is unchanged.
+
+        Args:
+            text: The content now on disk or in the editor.
+            encoded: text already encoded as UTF-8, if the caller has it, so it is not encoded again.
+        """
+        if text == self.hashed_text and self.file_hash:
+            return
+        self.hashed_text = text
+        self.file_hash = content_hash(encoded if encoded is not None else text)
 
     def set_code(self, code: str):
-        """Replace editor content programmatically without triggering on_manual_edit.
+        """Replace editor content programmatically without emitting manual_edit.
 
         Args:
             code: Full Python source to display in the editor.
         """
-        self.internal_update = True
-        self.editor.setText(code)
-        self.file_hash = hashlib.md5(code.encode()).hexdigest()
-        self.internal_update = False
-        self.highlight_action_blocks()
+        self.update_file_hash(code)
+        if self.show_text(code):
+            self.highlight_action_blocks()
 
     def get_code(self) -> str:
         """Return the current editor content as a plain string."""
-        return self.editor.text()
+        return self.buffered_code if self.buffered_code is not None else self.editor.text()
 
-    def load_file(self):
-        """Read current_file from disk and populate the editor, suppressing callbacks."""
-        if self.current_file and self.current_file.exists():
-            content = self.current_file.read_text()
-            self.internal_update = True
-            self.editor.setText(content)
-            self.file_hash = hashlib.md5(content.encode()).hexdigest()
-            self.internal_update = False
+    def load_file(self) -> bool:
+        """Read current_file from disk and populate the editor, suppressing callbacks.
 
-    def on_text_changed(self):
-        """Handle editor text changes, ignoring changes made programmatically."""
-        if self.internal_update:
+        Returns:
+            True if the file was read, False if there is no current file or it could not be read.
+        """
+        if not self.current_file:
+            return False
+        try:
+            data = self.current_file.read_bytes()
+        except OSError:
+            return False
+        content = data.decode("utf-8")
+        self.remember_file_stat()
+        self.show_text(content)
+        self.update_file_hash(content, data)
+        return True
+
+    def remember_file_stat(self):
+        """Record the on-disk stamp of current_file, or None when it cannot be stat'ed."""
+        try:
+            st = self.current_file.stat()
+        except OSError:
+            self.file_stat = None
             return
-        self.highlight_action_blocks()
-        if self.on_manual_edit:
-            self.on_manual_edit(self.get_code())
+        self.file_stat = (st.st_mtime_ns, st.st_size)
+
+    def on_text_changed(self):
+        """Handle user edits; programmatic updates go through show_text with signals blocked."""
+        self.highlight_timer.start()
+        self.manual_edit.emit()
 
     def get_marker_for_action(self, action_name: str) -> int:
         """Return the QScintilla marker ID for an action, allocating one if needed.
 
-        QScintilla supports at most MAX_ACTION_MARKERS distinct markers.
-        When that limit is reached, -1 is returned and no highlighting is applied.
+        QScintilla supports at most MAX_ACTION_MARKERS distinct markers. Once they are all allocated, further
+        actions share an existing marker (and its tint), picked deterministically from the name, so every block
+        stays highlighted.
 
         Args:
             action_name: The action title string used to identify the marker.
 
         Returns:
-            The marker ID, or -1 if the limit has been exceeded.
+            The marker ID.
         """
-        if action_name in self.marker_colors:
-            return self.marker_colors[action_name]
+        marker_id = self.marker_colors.get(action_name)
+        if marker_id is not None:
+            return marker_id
 
-        # If we exceed the max markers, skip highlighting
         if self.next_marker >= MAX_ACTION_MARKERS:
-            return -1
+            marker_id = zlib.crc32(action_name.encode()) % MAX_ACTION_MARKERS
+            self.marker_colors[action_name] = marker_id
+            return marker_id
 
         # Assign a new marker ID for this action
         marker_id = self.next_marker
@@ -176,27 +294,32 @@ class CodePanel(QWidget):
         "# [N] Title" comments. Lines from the comment through the following call-site
         (or inline block) are highlighted with the color assigned to that action's title.
         """
-        for marker_id in range(MAX_ACTION_MARKERS):
-            self.editor.markerDeleteAll(marker_id)
+        if self.editor is None or self.buffered_code is not None:
+            return
+        # One repaint for the whole pass instead of one per marker change
+        self.editor.setUpdatesEnabled(False)
+        try:
+            self.apply_action_markers()
+        finally:
+            self.editor.setUpdatesEnabled(True)
+
+    def apply_action_markers(self):
+        """Replace every action marker in the editor according to the current text."""
+        # Action markers are the only markers in the editor, so they are cleared in a single call
+        self.editor.markerDeleteAll()
 
         text = self.editor.text()
-        lines = text.split("\n")
-
-        header_re = re.compile(r"^#\s*\[(\d+)]\s*(.*?)\s*$")
+        section = PIPELINE_LINE_RE.search(text)
+        if section is None:
+            return
+        # Line number of the first line after the section header; the functions section is never split
+        offset = text.count("\n", 0, section.end()) + 1
+        lines = text[section.end() + 1:].split("\n")
 
         i = 0
-        in_pipeline = False
         while i < len(lines):
             stripped = lines[i].strip()
-            if stripped == "# --- Pipeline ---":
-                in_pipeline = True
-                i += 1
-                continue
-            if not in_pipeline:
-                i += 1
-                continue
-
-            match = header_re.match(stripped)
+            match = BLOCK_HEADER_RE.match(stripped) if stripped.startswith("#") else None
             if match:
                 action_name = match.group(2).strip()
                 marker_id = self.get_marker_for_action(action_name)
@@ -204,7 +327,10 @@ class CodePanel(QWidget):
                 i += 1
 
                 # Mark all body lines until the next action header
-                while i < len(lines) and not header_re.match(lines[i].strip()):
+                while i < len(lines):
+                    body = lines[i].strip()
+                    if body.startswith("#") and BLOCK_HEADER_RE.match(body):
+                        break
                     i += 1
 
                 # Trim trailing blank lines from the highlighted range
@@ -212,7 +338,7 @@ class CodePanel(QWidget):
                 while end_line > start_line + 1 and not lines[end_line - 1].strip():
                     end_line -= 1
 
-                for line_num in range(start_line, end_line):
+                for line_num in range(offset + start_line, offset + end_line):
                     self.editor.markerAdd(line_num, marker_id)
             else:
                 i += 1
@@ -220,25 +346,48 @@ class CodePanel(QWidget):
     def on_file_changed(self, path: str):
         """Respond to a QFileSystemWatcher notification for the watched file.
 
-        Re-adds the path to the watcher after a short debounce delay.
-        When the content hash differs from the last known hash, pending_external_change is set and
-        on_external_change is called.
+        The actual check is deferred until notifications have been quiet for FILE_CHANGE_DEBOUNCE_MS, so a burst
+        of writes from an external editor results in a single read.
 
         Args:
             path: The file-system path that triggered the change event.
         """
+        if self.current_file:
+            self.file_change_timer.start()
+
+    def check_file_change(self):
+        """Re-read the watched file after a debounced change notification.
+
+        Re-adds the path to the watcher, which drops files that are replaced on save.
+        When the file's mtime and size match the last read and the mtime is older than RECENT_WRITE_WINDOW_NS,
+        nothing is read. Otherwise, when the content hash
+        differs from the last known hash, pending_external_change is set and external_change is emitted.
+        """
         if not self.current_file:
             return
 
-        # Debounce rapid file change events by waiting a short time before re-adding the path to the watcher
-        QTimer.singleShot(100, lambda: self.watcher.addPath(path))
+        try:
+            st = self.current_file.stat()
+        except OSError:
+            return
+
+        path = str(self.current_file)
+        if path not in self.watcher.files():
+            self.watcher.addPath(path)
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self.file_stat and time.time_ns() - st.st_mtime_ns > RECENT_WRITE_WINDOW_NS:
+            return
+        self.file_stat = stamp
 
         # Check for file changes and update the editor if needed
-        if self.current_file.exists():
-            new_content = self.current_file.read_text()
-            new_hash = hashlib.md5(new_content.encode()).hexdigest()
-
-            if new_hash != self.file_hash:
-                self.pending_external_change = True
-                if self.on_external_change:
-                    self.on_external_change()
+        try:
+            data = self.current_file.read_bytes()
+        except OSError:
+            return
+        if data.decode("utf-8", errors="replace") == self.hashed_text:
+            return
+
+        if content_hash(data) != self.file_hash:
+            self.pending_external_change = True
+            self.external_change.emit()
@@ -8,9 +8,11 @@ The time-series tab embeds an MNE interactive browser widget.
 
 import logging
 import warnings
+import weakref
+from collections import OrderedDict
 from typing import Callable
 
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import (
     QApplication,
     QLabel,
@@ -56,6 +58,9 @@ class PlotWorker(QThread):
                 return
         self.result_ready.emit(result, [str(w.message) for w in caught])
 
+# Number of data objects whose rendered PSD/topomap figures are kept for revisiting
+FIGURE_CACHE_SIZE = 4
+
 # Tab indices for each mode
 RAW_TAB_NAMES = ["Time Series", "PSD", "Sensors", "Topomap"]
 EPOCHS_TAB_NAMES = ["PSD", "Epochs Browser", "Sensors", "Topomap", "Epochs Image"]
@@ -87,9 +92,16 @@ class VisualizationPanel(QWidget):
         plot_topomap: PlotCanvas for the topomap plot.
         plot_image: PlotCanvas for the epochs image plot (Epochs mode only).
         current_data: The MNE object currently being visualized.
+        shown_step: Step index passed to the last update_plots() call.
         psd_data_id: id of the data used for the cached PSD, to skip redraws.
+        psd_cache: (weak reference to the data, Spectrum) of the last computed PSD, shared by the
+            PSD and topomap tabs.
         topomap_data_id: id of the data used for the cached topomap.
+        sensors_key: Channel names, positions and bads of the cached sensor map.
+        figure_cache: Rendered figures by slot ("psd", "topomap") for recently shown data objects,
+            keyed by data id and holding a weak reference to validate the entry.
         browser: The embedded MNE browser widget, or None.
+        pending_browser: (data, placeholder, layout, idle text) of a queued browser build, or None.
         mode: Current tab mode: "raw", "epochs", or "evoked".
     """
 
@@ -97,15 +109,27 @@ class VisualizationPanel(QWidget):
         super().__init__(parent)
         self.current_data = None
         self.psd_data_id = None
+        self.psd_cache = None
         self.topomap_data_id = None
+        self.sensors_key = None
+        self.figure_cache: OrderedDict[int, tuple[weakref.ref, dict[str, Figure]]] = OrderedDict()
         self.browser = None
         self.browser_data_id = None
+        self.pending_browser = None
         self.mode = "raw"
         # Worker management
         self.slot_workers: dict[str, PlotWorker] = {}
         self.orphaned_workers: set[PlotWorker] = set()
         self.loading_count = 0
         self.current_step = 0
+        self.shown_step = -1
+
+        # Browser construction runs from the event loop so the loading label paints first;
+        # requests made before it fires collapse into one build for the latest data
+        self.browser_timer = QTimer(self)
+        self.browser_timer.setSingleShot(True)
+        self.browser_timer.setInterval(0)
+        self.browser_timer.timeout.connect(self.build_pending_browser)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -115,11 +139,12 @@ class VisualizationPanel(QWidget):
 
         self.tabs = QTabWidget()
 
-        self.plot_psd = PlotCanvas()
-        self.plot_evoked = PlotCanvas()
-        self.plot_sensors = PlotCanvas()
-        self.plot_topomap = PlotCanvas()
-        self.plot_image = PlotCanvas()
+        # Canvases show a plain label until their tab renders a figure
+        self.plot_psd = PlotCanvas(placeholder="Load data to view")
+        self.plot_evoked = PlotCanvas(placeholder="Load data to view")
+        self.plot_sensors = PlotCanvas(placeholder="Load data to view")
+        self.plot_topomap = PlotCanvas(placeholder="Load data to view")
+        self.plot_image = PlotCanvas(placeholder="Load data to view")
 
         # Time-series tab (Raw mode)
         self.time_container = QWidget()
@@ -144,6 +169,7 @@ class VisualizationPanel(QWidget):
         layout.addWidget(self.status_label)
         self.build_raw_tabs()
         layout.addWidget(self.tabs)
+        self.tabs.currentChanged.connect(self.on_tab_changed)
 
         self.plot_warning_label = QLabel("")
         self.plot_warning_label.setStyleSheet("color: #CC7700; font-size: 9pt; padding: 2px 6px;")
@@ -223,24 +249,7 @@ class VisualizationPanel(QWidget):
         data_id = id(self.current_data)
         if self.browser is not None and self.browser_data_id == data_id:
             return
-        self.show_browser_loading(self.time_placeholder)
-        try:
-            self.close_browser()
-            self.time_placeholder.setVisible(False)
-            with warnings.catch_warnings(record=True) as caught:
-                warnings.simplefilter("always")
-                self.browser = self.current_data.plot(show=False)
-            self.update_plot_warning([str(w.message) for w in caught])
-            self.browser_data_id = data_id
-            self.sanitize_browser_toolbar()
-            self.time_layout.addWidget(self.browser)
-            self.browser.setVisible(True)
-        except Exception as e:
-            logger.warning("Time-series plot update failed: %s", e)
-            self.time_placeholder.setVisible(True)
-            self.time_placeholder.setText("Load data to view")
-        finally:
-            self.clear_browser_loading()
+        self.schedule_browser(self.time_placeholder, self.time_layout, "Load data to view")
 
     def update_epochs_browser(self):
         """Render the epochs browser tab by embedding an MNE Epochs browser widget."""
@@ -249,32 +258,64 @@ class VisualizationPanel(QWidget):
         data_id = id(self.current_data)
         if self.browser is not None and self.browser_data_id == data_id:
             return
-        self.show_browser_loading(self.epochs_placeholder)
+        self.schedule_browser(self.epochs_placeholder, self.epochs_layout, "Run epoching to view")
+
+    def schedule_browser(self, placeholder: QLabel, container_layout: QVBoxLayout, idle_text: str) -> None:
+        """Show the loading label and queue a browser build for the current data.
+
+        Args:
+            placeholder: Label of the browser container, shown while loading or on failure.
+            container_layout: Layout the browser widget is added to.
+            idle_text: Text restored on the placeholder if the build fails.
+        """
+        if self.pending_browser is None:
+            self.show_browser_loading(placeholder)
+        else:
+            placeholder.setText("Loading...")
+            placeholder.setVisible(True)
+        self.pending_browser = (self.current_data, placeholder, container_layout, idle_text)
+        self.browser_timer.start()
+
+    def build_pending_browser(self) -> None:
+        """Build the queued MNE browser, unless its data is no longer the one being shown."""
+        if self.pending_browser is None:
+            return
+        data, placeholder, container_layout, idle_text = self.pending_browser
+        self.pending_browser = None
         try:
+            if data is not self.current_data:
+                return
             self.close_browser()
-            self.epochs_placeholder.setVisible(False)
+            placeholder.setVisible(False)
             with warnings.catch_warnings(record=True) as caught:
                 warnings.simplefilter("always")
-                self.browser = self.current_data.plot(show=False)
+                self.browser = data.plot(show=False)
             self.update_plot_warning([str(w.message) for w in caught])
-            self.browser_data_id = data_id
+            self.browser_data_id = id(data)
             self.sanitize_browser_toolbar()
-            self.epochs_layout.addWidget(self.browser)
+            container_layout.addWidget(self.browser)
             self.browser.setVisible(True)
         except Exception as e:
-            logger.warning("Epochs browser update failed: %s", e)
-            self.epochs_placeholder.setVisible(True)
-            self.epochs_placeholder.setText("Run epoching to view")
+            logger.warning("Browser update failed: %s", e)
+            placeholder.setVisible(True)
+            placeholder.setText(idle_text)
         finally:
             self.clear_browser_loading()
 
     def show_placeholder(self):
         """Show placeholder text when no data is loaded."""
         self.psd_data_id = None
+        self.psd_cache = None
         self.topomap_data_id = None
+        self.sensors_key = None
+        self.figure_cache.clear()
         self.browser_data_id = None
+        if self.pending_browser is not None:
+            self.browser_timer.stop()
+            self.pending_browser = None
+            self.clear_browser_loading()
         for plot in [self.plot_psd, self.plot_evoked, self.plot_sensors, self.plot_topomap, self.plot_image]:
-            plot.update_figure(make_loading_fig("Load data to view", color="#999999", fontstyle="normal"))
+            plot.show_placeholder_text("Load data to view")
         self.close_browser()
         self.time_placeholder.setVisible(True)
         self.epochs_placeholder.setVisible(True)
@@ -299,7 +340,7 @@ class VisualizationPanel(QWidget):
 
         Switches between tab sets when the data type changes.
         Sets status_label when the requested step has not been computed yet.
-        Reconnects the tab-changed signal so that switching tabs triggers a fresh render.
+        Does nothing else when called again with the same data object and step.
 
         Args:
             data: The MNE object to visualize, or None to show a placeholder.
@@ -307,13 +348,19 @@ class VisualizationPanel(QWidget):
             fallback_label: When not None, shows a warning that the step is not computed
                 and names the fallback step being shown instead.
         """
+        unchanged = data is not None and data is self.current_data and current_step == self.shown_step
         self.current_data = data
+        self.shown_step = current_step
 
         if fallback_label is not None and current_step > 0:
             self.status_label.setText(f"not computed; showing {fallback_label}")
         else:
             self.status_label.setText("")
 
+        # Same object at the same step: the active tab already shows it
+        if unchanged:
+            return
+
         if data is None:
             self.show_placeholder()
             return
@@ -327,12 +374,17 @@ class VisualizationPanel(QWidget):
 
         if new_mode != self.mode:
             current_tab = 0
-            if new_mode == "epochs":
-                self.build_epochs_tabs()
-            elif new_mode == "evoked":
-                self.build_evoked_tabs()
-            else:
-                self.build_raw_tabs()
+            # Rebuilding the tab set emits currentChanged; the first tab is rendered below instead
+            self.tabs.blockSignals(True)
+            try:
+                if new_mode == "epochs":
+                    self.build_epochs_tabs()
+                elif new_mode == "evoked":
+                    self.build_evoked_tabs()
+                else:
+                    self.build_raw_tabs()
+            finally:
+                self.tabs.blockSignals(False)
         else:
             current_tab = self.tabs.currentIndex()
 
@@ -343,12 +395,6 @@ class VisualizationPanel(QWidget):
         else:
             self.render_raw_tab(current_tab)
 
-        try:
-            self.tabs.currentChanged.disconnect()
-        except TypeError:
-            pass
-        self.tabs.currentChanged.connect(self.on_tab_changed)
-
 
     # ------- Loading / worker helpers --------
 
@@ -387,23 +433,7 @@ class VisualizationPanel(QWidget):
             render_fn: Runs on the main thread; receives the compute_fn result; returns a Figure.
             message: Text shown in the loading placeholder.
         """
-        # Discard result from any previous worker for this slot.
-        # Keep a strong reference in orphaned_workers until the OS thread exits.
-        old = self.slot_workers.pop(slot_key, None)
-        if old is not None:
-            try:
-                old.result_ready.disconnect()
-            except TypeError:
-                pass
-            try:
-                old.finished.disconnect()
-            except TypeError:
-                pass
-            self.finish_loading()  # balance the start_loading() that was called for the old worker
-            self.orphaned_workers.add(old)
-            old.finished.connect(lambda: self.orphaned_workers.discard(old),
-                                 Qt.ConnectionType.QueuedConnection)
-
+        self.discard_worker(slot_key)
         self.start_loading(canvas, message)
 
         worker = PlotWorker(compute_fn)
@@ -435,6 +465,64 @@ class VisualizationPanel(QWidget):
         worker.finished.connect(on_thread_exit, Qt.ConnectionType.QueuedConnection)
         worker.start()
 
+    def discard_worker(self, slot_key: str) -> None:
+        """Drop the result of any running worker for slot_key.
+
+        Keeps a strong reference in orphaned_workers until the OS thread exits.
+        """
+        old = self.slot_workers.pop(slot_key, None)
+        if old is None:
+            return
+        try:
+            old.result_ready.disconnect()
+        except TypeError:
+            pass
+        try:
+            old.finished.disconnect()
+        except TypeError:
+            pass
+        self.finish_loading()  # balance the start_loading() that was called for the old worker
+        self.orphaned_workers.add(old)
+        old.finished.connect(lambda: self.orphaned_workers.discard(old),
+                             Qt.ConnectionType.QueuedConnection)
+
+    # ------- Figure cache --------
+
+    def cached_figure(self, slot: str, data) -> Figure | None:
+        """Return the figure previously rendered for data in slot, or None."""
+        entry = self.figure_cache.get(id(data))
+        if entry is None or entry[0]() is not data:
+            return None
+        self.figure_cache.move_to_end(id(data))
+        return entry[1].get(slot)
+
+    def cache_figure(self, slot: str, data, fig: Figure) -> None:
+        """Remember fig as the slot figure for data, evicting the least recently used data."""
+        key = id(data)
+        entry = self.figure_cache.get(key)
+        # A dead or foreign reference means the id was reused by a new object
+        if entry is None or entry[0]() is not data:
+            entry = (weakref.ref(data), {})
+            self.figure_cache[key] = entry
+            if len(self.figure_cache) > FIGURE_CACHE_SIZE:
+                self.figure_cache.popitem(last=False)
+        self.figure_cache.move_to_end(key)
+        entry[1][slot] = fig
+
+    def show_cached_figure(self, slot: str, canvas: PlotCanvas, data) -> bool:
+        """Put the cached slot figure for data back on canvas, cancelling any pending render.
+
+        Returns:
+            True if a cached figure was shown.
+        """
+        fig = self.cached_figure(slot, data)
+        if fig is None:
+            return False
+        self.discard_worker(slot)
+        canvas.update_figure(fig)
+        self.update_plot_warning([])
+        return True
+
     def show_browser_loading(self, label: QLabel) -> None:
         """Show a loading label in a browser container and push the wait cursor."""
         label.setText("Loading...")
@@ -442,14 +530,14 @@ class VisualizationPanel(QWidget):
         self.loading_count += 1
         if self.loading_count == 1:
             QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-        QApplication.processEvents()
 
     def clear_browser_loading(self) -> None:
-        """Pop the wait cursor after a synchronous browser-load operation."""
+        """Pop the wait cursor after a queued browser build has run or been dropped."""
         self.finish_loading()
 
     # ------- Plot update methods --------
 
+    @pyqtSlot(int)
     def on_tab_changed(self, index: int):
         """Render the newly selected tab when the user switches tabs.
 
@@ -498,6 +586,15 @@ class VisualizationPanel(QWidget):
         elif index == 2:
             self.update_sensors_plot()
 
+    def psd_compute_fn(self, data) -> Callable:
+        """Return a compute function for the PSD of data, reusing the cached Spectrum if it matches."""
+        # Compared by identity through the weak reference: ids of freed checkpoints get reused
+        if self.psd_cache is not None and self.psd_cache[0]() is data:
+            spectrum = self.psd_cache[1]
+            return lambda: spectrum
+        fmax = min(60.0, data.info["sfreq"] / 2)
+        return lambda: data.compute_psd(fmax=fmax)
+
     def update_psd_plot(self):
         """Compute and display the PSD plot in a background thread, skipping if data is unchanged."""
         if self.current_data is None:
@@ -506,16 +603,21 @@ class VisualizationPanel(QWidget):
         if data_id == self.psd_data_id:
             return
         data = self.current_data
+        if self.show_cached_figure("psd", self.plot_psd, data):
+            self.psd_data_id = data_id
+            return
 
         def render(spectrum):
+            self.psd_cache = (weakref.ref(data), spectrum)
             fig = spectrum.plot(show=False)
             disable_psd_span_popups(fig)
             self.psd_data_id = data_id
+            self.cache_figure("psd", data, fig)
             return fig
 
-        fmax = min(60.0, data.info["sfreq"] / 2)
-        self.run_plot_worker("psd", self.plot_psd,
-                             lambda: data.compute_psd(fmax=fmax), render, "Computing PSD...")
+        # The canvas is about to show a loading figure, not the previous data's PSD
+        self.psd_data_id = None
+        self.run_plot_worker("psd", self.plot_psd, self.psd_compute_fn(data), render, "Computing PSD...")
 
     def update_evoked_plot(self):
         """Render an evoked waveform plot on the main thread."""
@@ -536,30 +638,48 @@ class VisualizationPanel(QWidget):
             info = data.info if hasattr(data, "info") else None
             if info is None:
                 return False
-            if bool(info.get("dig")):
+            # Digitization is the cheap check; channel locations are only scanned without it
+            if info.get("dig"):
                 return True
-            import mne.io.constants as C
-            eeg_chs = [ch for ch in info["chs"] if ch["kind"] == C.FIFF.FIFFV_EEG_CH]
-            return any(ch["loc"][:3].any() for ch in eeg_chs)
+            eeg_kind = mne.io.constants.FIFF.FIFFV_EEG_CH
+            return any(ch["kind"] == eeg_kind and ch["loc"][:3].any() for ch in info["chs"])
         except Exception:
             return False
 
+    @staticmethod
+    def sensor_layout_key(info) -> tuple:
+        """Return what the sensor map depends on: channel names, positions and bad channels."""
+        return (
+            tuple((ch["ch_name"], *ch["loc"][:3].tolist()) for ch in info["chs"]),
+            tuple(info["bads"]),
+        )
+
     def update_sensors_plot(self):
-        """Render a sensor map plot on the main thread."""
+        """Render a sensor map plot on the main thread, skipping if the sensor layout is unchanged."""
         if self.current_data is None:
             return
         if not self.has_electrode_positions(self.current_data):
+            self.sensors_key = None
             self.plot_sensors.update_figure(
                 make_loading_fig("No electrode positions available", color="#aaaaaa", fontstyle="normal")
             )
             return
+        # Most steps (filtering, ICA, ...) leave the sensors untouched
+        key = self.sensor_layout_key(self.current_data.info)
+        if key == self.sensors_key:
+            return
         data = self.current_data
 
         def render(d):
             if isinstance(d, mne.Evoked):
-                return mne.viz.plot_sensors(d.info, show=False, show_names=True, kind="topomap")
-            return d.plot_sensors(show=False, show_names=True, kind="topomap")
+                fig = mne.viz.plot_sensors(d.info, show=False, show_names=True, kind="topomap")
+            else:
+                fig = d.plot_sensors(show=False, show_names=True, kind="topomap")
+            self.sensors_key = key
+            return fig
 
+        # The canvas is about to show a loading figure, not the previous sensor map
+        self.sensors_key = None
         self.run_plot_worker("sensors", self.plot_sensors, lambda: data, render, "Rendering sensor map...")
 
     def update_topomap_plot(self):
@@ -567,6 +687,7 @@ class VisualizationPanel(QWidget):
         if self.current_data is None:
             return
         if not self.has_electrode_positions(self.current_data):
+            self.topomap_data_id = None
             self.plot_topomap.update_figure(
                 make_loading_fig("No electrode positions available", color="#aaaaaa", fontstyle="normal")
             )
@@ -575,21 +696,28 @@ class VisualizationPanel(QWidget):
         if data_id == self.topomap_data_id:
             return
         data = self.current_data
+        if self.show_cached_figure("topomap", self.plot_topomap, data):
+            self.topomap_data_id = data_id
+            return
 
+        self.topomap_data_id = None
         if isinstance(data, mne.Evoked):
             def render_evoked_topo(d):
                 fig = d.plot_topomap(times="auto", show=False)
                 self.topomap_data_id = data_id
+                self.cache_figure("topomap", data, fig)
                 return fig
             self.run_plot_worker("topomap", self.plot_topomap,
                                  lambda: data, render_evoked_topo, "Computing topomap...")
         else:
             def render_psd_topo(spectrum):
+                self.psd_cache = (weakref.ref(data), spectrum)
                 fig = spectrum.plot_topomap(show=False)
                 self.topomap_data_id = data_id
+                self.cache_figure("topomap", data, fig)
                 return fig
             self.run_plot_worker("topomap", self.plot_topomap,
-                                 lambda: data.compute_psd(fmax=60), render_psd_topo, "Computing topomap...")
+                                 self.psd_compute_fn(data), render_psd_topo, "Computing topomap...")
 
     def update_image_plot(self):
         """Render an epochs image plot on the main thread (Epochs mode only)."""
@@ -4,9 +4,58 @@ Exports a single factory function, create_code_editor(), that returns a fully
 configured QsciScintilla instance matching the application's dark color scheme.
 """
 
+import functools
+
 from PyQt6.QtGui import QColor, QFont
 from PyQt6.Qsci import QsciScintilla, QsciLexerPython
 
+# Theme palette
+BG_COLOR = QColor("#1E1E1E")
+FG_COLOR = QColor("#A9B7C6")
+MARGIN_FG_COLOR = QColor("#858585")
+CARET_LINE_COLOR = QColor("#2B2B2B")
+SELECTION_BG_COLOR = QColor("#214283")
+COMMENT_COLOR = QColor("#7A7E85")
+NUMBER_COLOR = QColor("#2AACB8")
+STRING_COLOR = QColor("#6AAB73")
+KEYWORD_COLOR = QColor("#CF8E6D")
+DEFINITION_COLOR = QColor("#56A8F5")
+ERROR_COLOR = QColor("#E06C75")
+
+# (color, style id) pairs for the Python lexer's token styles. The f-string and
+# unclosed-string styles only exist in newer QScintilla versions, so they are
+# looked up by name once, here.
+LEXER_STYLE_COLORS: tuple[tuple[QColor, int], ...] = tuple(
+    (color, getattr(QsciLexerPython, name))
+    for color, names in [
+        (FG_COLOR,         ["Default", "Operator", "Identifier"]),
+        (COMMENT_COLOR,    ["Comment", "CommentBlock"]),
+        (NUMBER_COLOR,     ["Number"]),
+        (STRING_COLOR,     ["SingleQuotedString", "DoubleQuotedString",
+                            "TripleSingleQuotedString", "TripleDoubleQuotedString",
+                            "SingleQuotedFString", "DoubleQuotedFString",
+                            "TripleSingleQuotedFString", "TripleDoubleQuotedFString"]),
+        (KEYWORD_COLOR,    ["Keyword"]),
+        (DEFINITION_COLOR, ["ClassName", "FunctionMethodName", "Decorator"]),
+        (ERROR_COLOR,      ["UnclosedString"]),
+    ]
+    for name in names
+    if hasattr(QsciLexerPython, name)
+)
+
+
+@functools.cache
+def editor_fonts() -> tuple[QFont, QFont]:
+    """Return the editor font and its bold keyword variant.
+
+    Built on first use rather than at import, since fonts need a running QApplication.
+    """
+    font = QFont("Consolas", 11)
+    font.setFixedPitch(True)
+    kw_font = QFont(font)
+    kw_font.setBold(True)
+    return font, kw_font
+
 
 def create_code_editor(parent=None) -> QsciScintilla:
     """Create a QsciScintilla editor with a dark theme and Python syntax highlighting.
@@ -22,8 +71,7 @@ def create_code_editor(parent=None) -> QsciScintilla:
     """
     editor = QsciScintilla(parent)
 
-    font = QFont("Consolas", 11)
-    font.setFixedPitch(True)
+    font, kw_font = editor_fonts()
     editor.setFont(font)
 
     editor.setUtf8(True)
@@ -36,57 +84,34 @@ def create_code_editor(parent=None) -> QsciScintilla:
     # Line numbers
     editor.setMarginType(0, QsciScintilla.MarginType.NumberMargin)
     editor.setMarginWidth(0, "0000")
-    editor.setMarginsForegroundColor(QColor("#858585"))
-    editor.setMarginsBackgroundColor(QColor("#1E1E1E"))
+    editor.setMarginsForegroundColor(MARGIN_FG_COLOR)
+    editor.setMarginsBackgroundColor(BG_COLOR)
 
-    editor.setPaper(QColor("#1E1E1E"))
-    editor.setColor(QColor("#A9B7C6"))
-    editor.setCaretForegroundColor(QColor("#A9B7C6"))
+    editor.setPaper(BG_COLOR)
+    editor.setColor(FG_COLOR)
+    editor.setCaretForegroundColor(FG_COLOR)
     editor.setCaretLineVisible(True)
-    editor.setCaretLineBackgroundColor(QColor("#2B2B2B"))
-    editor.setSelectionBackgroundColor(QColor("#214283"))
-    editor.setSelectionForegroundColor(QColor("#A9B7C6"))
+    editor.setCaretLineBackgroundColor(CARET_LINE_COLOR)
+    editor.setSelectionBackgroundColor(SELECTION_BG_COLOR)
+    editor.setSelectionForegroundColor(FG_COLOR)
 
     # Lexer
     lexer = QsciLexerPython(editor)
-    lexer.setFont(font)
-    lexer.setDefaultPaper(QColor("#1E1E1E"))
-    lexer.setDefaultColor(QColor("#A9B7C6"))
+    lexer.setDefaultPaper(BG_COLOR)
+    lexer.setDefaultColor(FG_COLOR)
 
-    # Set background and font for all styles
+    # Without a style number the background covers every lexer-defined style; the
+    # remaining ids already fall back to the default paper. Fonts have no such fallback.
+    lexer.setPaper(BG_COLOR)
     for i in range(128):
-        lexer.setPaper(QColor("#1E1E1E"), i)
         lexer.setFont(font, i)
 
     # Token colors
-    P = QsciLexerPython
-    str_color = QColor("#6AAB73")
-    for color, styles in [
-        (QColor("#A9B7C6"), [P.Default, P.Operator, P.Identifier]),
-        (QColor("#7A7E85"), [P.Comment, P.CommentBlock]),
-        (QColor("#2AACB8"), [P.Number]),
-        (str_color,         [P.SingleQuotedString, P.DoubleQuotedString,
-                             P.TripleSingleQuotedString, P.TripleDoubleQuotedString]),
-        (QColor("#CF8E6D"), [P.Keyword]),
-        (QColor("#56A8F5"), [P.ClassName, P.FunctionMethodName, P.Decorator]),
-    ]:
-        for style in styles:
-            lexer.setColor(color, style)
-
-    # Version-dependent styles
-    for color, names in [
-        (str_color,         ["SingleQuotedFString", "DoubleQuotedFString",
-                             "TripleSingleQuotedFString", "TripleDoubleQuotedFString"]),
-        (QColor("#E06C75"), ["UnclosedString"]),
-    ]:
-        for name in names:
-            if (style_id := getattr(P, name, None)) is not None:
-                lexer.setColor(color, style_id)
+    for color, style in LEXER_STYLE_COLORS:
+        lexer.setColor(color, style)
 
     # Bold keywords
-    kw_font = QFont(font)
-    kw_font.setBold(True)
-    lexer.setFont(kw_font, P.Keyword)
+    lexer.setFont(kw_font, QsciLexerPython.Keyword)
 
     editor.setLexer(lexer)
     return editor
@@ -7,14 +7,23 @@ Exports:
         step expansion and an inline run button.
 """
 
-from PyQt6.QtWidgets import QAbstractItemView, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListWidget, QToolBar
-from PyQt6.QtCore import pyqtSignal, QSize, Qt
+from PyQt6.QtWidgets import (
+    QAbstractItemView, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListWidget, QListWidgetItem, QToolBar
+)
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, QSize, Qt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT
 from matplotlib.figure import Figure
 
 from mnetape.actions.registry import get_action_title
 from mnetape.core.models import CUSTOM_ACTION_ID, ActionConfig, ActionStatus, STATUS_ICONS, STATUS_COLORS
 
+# Fixed height of every action-list row widget
+ACTION_ROW_HEIGHT = 46
+
+# Status icon stylesheets, built once so rows reuse the same strings
+STATUS_STYLES = {status: f"color: {color}; font-weight: bold;" for status, color in STATUS_COLORS.items()}
+TYPE_MISMATCH_STYLE = "color: #D32F2F; font-weight: bold;"
+
 
 def disable_psd_span_popups(fig: Figure) -> None:
     """Disable span selectors in MNE PSD figures that open popup windows."""
@@ -96,13 +105,24 @@ class PlotCanvas(QWidget):
     Provides update_figure() to swap in a new figure without rebuilding the
     widget; the old canvas and toolbar are scheduled for deletion via
     deleteLater().
+
+    When created with placeholder text and no figure, or after show_placeholder_text(),
+    only a QLabel is shown; the canvas and toolbar are built on the next update_figure() call.
     """
 
-    def __init__(self, fig=None, parent=None):
+    def __init__(self, fig=None, parent=None, placeholder: str | None = None):
         super().__init__(parent)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
+        self.canvas = None
+        self.toolbar = None
+        self.placeholder_label = None
+
+        if fig is None and placeholder is not None:
+            self.show_placeholder_text(placeholder)
+            return
+
         if fig is None:
             fig = Figure(figsize=(8, 4))
 
@@ -122,6 +142,41 @@ class PlotCanvas(QWidget):
         Args:
             fig: The new matplotlib Figure to display.
         """
+        if self.placeholder_label is not None:
+            self.placeholder_label.setVisible(False)
+        self.release_canvas()
+
+        # Create new canvas and toolbar
+        layout = self.layout()
+        self.canvas = FigureCanvasQTAgg(fig)
+        self.toolbar = Toolbar(self.canvas, self)
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas, 1)
+        self.canvas.draw()
+
+    def show_placeholder_text(self, text: str):
+        """Show a text label in place of the figure, without creating any matplotlib objects.
+
+        The current canvas, toolbar and figure are released; the next update_figure()
+        call builds new ones.
+
+        Args:
+            text: Message to display.
+        """
+        self.release_canvas()
+        if self.placeholder_label is None:
+            self.placeholder_label = QLabel()
+            self.placeholder_label.setStyleSheet(
+                "color: #999999; font-size: 14pt; qproperty-alignment: AlignCenter;"
+            )
+            self.layout().addWidget(self.placeholder_label, 1)
+        self.placeholder_label.setText(text)
+        self.placeholder_label.setVisible(True)
+
+    def release_canvas(self):
+        """Remove the canvas and toolbar, schedule their deletion and close the figure."""
+        if self.canvas is None:
+            return
         import matplotlib.pyplot as plt
 
         layout = self.layout()
@@ -134,17 +189,12 @@ class PlotCanvas(QWidget):
         self.toolbar.set_message = lambda s: None
         self.toolbar.deleteLater()
         self.canvas.deleteLater()
+        self.canvas = None
+        self.toolbar = None
 
         # Release the old figure from the registry
         plt.close(old_fig)
 
-        # Create new canvas and toolbar
-        self.canvas = FigureCanvasQTAgg(fig)
-        self.toolbar = Toolbar(self.canvas, self)
-        layout.addWidget(self.toolbar)
-        layout.addWidget(self.canvas, 1)
-        self.canvas.draw()
-
 
 class PinnedActionItem(QWidget):
     """Non-moveable, non-selectable action row for implicit pipeline steps.
@@ -177,7 +227,7 @@ class PinnedActionItem(QWidget):
         layout.addWidget(self.name_label, 1, Qt.AlignmentFlag.AlignVCenter)
 
     def sizeHint(self) -> QSize:
-        return QSize(super().sizeHint().width(), 46)
+        return QSize(super().sizeHint().width(), ACTION_ROW_HEIGHT)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.RightButton:
@@ -195,11 +245,9 @@ class ActionListItem(QWidget):
     when the action's expected input type doesn't match the pipeline's current type.
 
     Signals:
-        size_changed: Emitted when the widget's size changes.
         run_clicked (row): Emitted when the inline run button is clicked.
     """
 
-    size_changed = pyqtSignal()
     run_clicked = pyqtSignal(int)
 
     def __init__(self, index: int, action: ActionConfig, parent=None,
@@ -209,6 +257,8 @@ class ActionListItem(QWidget):
         self.row = index - 1
         self.action = action
         self.type_mismatch = type_mismatch
+        self.needs_inspection = needs_inspection
+        self.list_item: QListWidgetItem | None = None
 
         self.setObjectName("action_item_widget")
 
@@ -223,19 +273,16 @@ class ActionListItem(QWidget):
         layout.addWidget(self.status_label, 0, Qt.AlignmentFlag.AlignVCenter)
 
         # Action name with custom/edited badge
-        name = get_action_title(action)
-        if action.is_custom:
-            name += " [CUSTOM]" if action.action_id == CUSTOM_ACTION_ID else " [EDITED]"
-        self.name_label = QLabel(f"{index}. {name}")
+        self.name_label = QLabel(self.display_name())
         self.name_label.setStyleSheet("font-weight: bold;")
         layout.addWidget(self.name_label, 1, Qt.AlignmentFlag.AlignVCenter)
 
         # Inspection badge
-        if needs_inspection:
-            inspect_label = QLabel("[!]")
-            inspect_label.setToolTip("Requires manual inspection before running")
-            inspect_label.setStyleSheet("color: #E65100; font-weight: bold;")
-            layout.addWidget(inspect_label, 0, Qt.AlignmentFlag.AlignVCenter)
+        self.inspect_label = QLabel("[!]")
+        self.inspect_label.setToolTip("Requires manual inspection before running")
+        self.inspect_label.setStyleSheet("color: #E65100; font-weight: bold;")
+        self.inspect_label.setVisible(needs_inspection)
+        layout.addWidget(self.inspect_label, 0, Qt.AlignmentFlag.AlignVCenter)
 
         # Run button
         self.run_btn = QPushButton("▶")
@@ -246,22 +293,74 @@ class ActionListItem(QWidget):
             "QPushButton:hover { background-color:#388E3C; }"
             "QPushButton:disabled { background-color:#BDBDBD; color:#757575; }"
         )
-        self.run_btn.clicked.connect(lambda _, r=self.row: self.run_clicked.emit(r))
+        self.run_btn.clicked.connect(self.on_run_clicked)
         if type_mismatch:
             self.run_btn.setEnabled(False)
         layout.addWidget(self.run_btn, 0, Qt.AlignmentFlag.AlignVCenter)
 
     def sizeHint(self) -> QSize:
-        return QSize(super().sizeHint().width(), 46)
+        return QSize(super().sizeHint().width(), ACTION_ROW_HEIGHT)
+
+    def set_list_item(self, item: QListWidgetItem):
+        """Attach the QListWidgetItem that hosts this widget and size it to the widget.
+
+        Rows have a fixed height, so the hint only needs refreshing when the title text changes.
+        """
+        self.list_item = item
+        item.setSizeHint(self.sizeHint())
+
+    @pyqtSlot()
+    def on_run_clicked(self):
+        self.run_clicked.emit(self.row)
+
+    def display_name(self) -> str:
+        """Return the numbered title shown in the name label, with a custom/edited badge."""
+        name = get_action_title(self.action)
+        if self.action.is_custom:
+            name += " [CUSTOM]" if self.action.action_id == CUSTOM_ACTION_ID else " [EDITED]"
+        return f"{self.index}. {name}"
+
+    def refresh(self):
+        """Re-read the action's title and status without rebuilding the widget."""
+        text = self.display_name()
+        if self.name_label.text() != text:
+            self.name_label.setText(text)
+            if self.list_item is not None:
+                self.list_item.setSizeHint(self.sizeHint())
+        self.update_status_icon()
+
+    def reconfigure(self, index: int, action: ActionConfig, type_mismatch: bool, needs_inspection: bool):
+        """Point the row at another action or position, updating its labels, badge and run button in place.
+
+        Args:
+            index: 1-based position shown in the name label.
+            action: The action now represented by this row.
+            type_mismatch: Whether the action's input type mismatches the pipeline's current type.
+            needs_inspection: Whether to show the manual-inspection badge.
+        """
+        self.index = index
+        self.row = index - 1
+        self.action = action
+        self.type_mismatch = type_mismatch
+        self.run_btn.setEnabled(not type_mismatch)
+        if self.needs_inspection != needs_inspection:
+            self.needs_inspection = needs_inspection
+            self.inspect_label.setVisible(needs_inspection)
+        self.refresh()
 
     def update_status_icon(self):
-        """Update the status icon label color to match the action's current status."""
+        """Update the status icon label color to match the action's current status.
+
+        The stylesheet is only reapplied when it changes, since every setStyleSheet call is re-parsed.
+        """
         if self.type_mismatch:
-            self.status_label.setText("⚠")
-            self.status_label.setStyleSheet("color: #D32F2F; font-weight: bold;")
+            text, style = "⚠", TYPE_MISMATCH_STYLE
         else:
-            self.status_label.setText(STATUS_ICONS[self.action.status])
-            self.status_label.setStyleSheet(f"color: {STATUS_COLORS[self.action.status]}; font-weight: bold;")
+            text, style = STATUS_ICONS[self.action.status], STATUS_STYLES[self.action.status]
+        if self.status_label.text() != text:
+            self.status_label.setText(text)
+        if self.status_label.styleSheet() != style:
+            self.status_label.setStyleSheet(style)
 
     def update_status(self, status: ActionStatus):
         """Set a new action status and refresh the status icon.
@@ -278,9 +377,12 @@ class ActionListWidget(QListWidget):
 
     Emits items_reordered(from_row, to_row) when an action item is dragged to a new
     position. Header items (UserRole == -1) cannot be dragged or used as drop targets.
+    Row widgets forward their run_clicked signal to run_requested(row), so consumers
+    connect once to the list instead of to every row.
     """
 
     items_reordered = pyqtSignal(int, int)
+    run_requested = pyqtSignal(int)
 
     def __init__(self, parent=None):
         super().__init__(parent)